@@ -5,10 +5,18 @@ ELBIX AIDD API 라우터
 """
 
 from fastapi import APIRouter, HTTPException, Query, Request, Depends
-from typing import List, Optional
+from fastapi.responses import JSONResponse, Response
+from typing import Any, List, Optional
 from shapely.geometry import shape, Point, LineString, Polygon, MultiPolygon
 import logging
 
+# orjson (선택적) - 미설치 시 표준 JSONResponse 사용
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 from app.models.request import DesignRequest
 from app.models.response import DesignResponse, RouteResult
 from app.config import settings
@@ -21,6 +29,18 @@ router = APIRouter(tags=["design"])
 
 logger = logging.getLogger(__name__)
 
+def _json_response(content: Any) -> Response:
+    """
+    dict 응답 직렬화
+    - Response를 직접 반환하여 FastAPI의 jsonable_encoder 재귀 변환을 생략
+    """
+    if ORJSON_AVAILABLE:
+        return Response(
+            content=orjson.dumps(content, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS),
+            media_type="application/json"
+        )
+    return JSONResponse(content=content)
+
 def parse_geometry(geom_data):
     """GeoJSON 지오메트리를 좌표로 변환"""
     if not geom_data:
@@ -54,7 +74,8 @@ async def create_design(
             eps_url=request.eps_url or settings.EPS_BASE_URL
         )
         result = await engine.run(coord=request.coord, phase_code=request.phase_code)
-        return result
+        # pydantic-core로 직접 JSON 직렬화 (dict 변환 후 json.dumps 경로 생략)
+        return Response(content=result.model_dump_json(), media_type="application/json")
     except Exception as e:
         logger.exception("설계 처리 중 치명적 오류 발생")
         raise HTTPException(status_code=500, detail=f"설계 처리 중 오류 발생: {str(e)}")
@@ -98,7 +119,10 @@ async def get_facilities(
             raise HTTPException(status_code=400, detail="bbox 또는 coord 파라미터가 필요합니다.")
         
         # 1. 데이터 수집
-        raw_data = await wfs_client.get_facilities_by_bbox(min_x, min_y, max_x, max_y, max_features)
+        # 철도/하천은 전처리/응답에 사용하지 않으므로 조회 생략
+        raw_data = await wfs_client.get_facilities_by_bbox(
+            min_x, min_y, max_x, max_y, max_features, include_water_rail=False
+        )
         
         # 2. 전처리 및 계통 복원 로직 적용
         preprocessor = DataPreprocessor()
@@ -116,9 +140,13 @@ async def get_facilities(
             "is_service_drop": l.is_service_drop, "properties": l.properties
         } for l in processed_data.lines]
         
-        # HV/LV 분리
-        lines_hv = [l for l in lines if l["line_type"] == "HV"]
-        lines_lv = [l for l in lines if l["line_type"] == "LV"]
+        # HV/LV 분리 (단일 순회)
+        lines_hv, lines_lv = [], []
+        for l in lines:
+            if l["line_type"] == "HV":
+                lines_hv.append(l)
+            elif l["line_type"] == "LV":
+                lines_lv.append(l)
         
         transformers = [{
             "id": tr.id,
@@ -149,7 +177,7 @@ async def get_facilities(
             },
             "bbox": {"min": [min_x, min_y], "max": [max_x, max_y]}
         }
-        return response
+        return _json_response(response)
     except Exception as e:
         logger.exception("시설물 조회 중 예외 발생")
         raise HTTPException(status_code=500, detail=str(e))
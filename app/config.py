@@ -15,6 +15,8 @@ class Settings(BaseSettings):
     APP_NAME: str = "ELBIX AIDD"
     APP_VERSION: str = "1.0.0"
     DEBUG: bool = True
+    # 함수 프로파일링 데코레이터 적용 여부 (운영 배포 시 False: import 시점에 데코레이터 제거)
+    PROFILING_ENABLED: bool = True
     
     # ===== WFS 서버 URL =====
     # GIS WFS: 전주, 전선, 변압기
@@ -236,6 +238,38 @@ class Settings(BaseSettings):
     
     # ===== HTTP 클라이언트 설정 =====
     HTTP_TIMEOUT: float = 30.0  # seconds
+    HTTP_POOL_LIMIT: int = 64            # 전체 최대 동시 연결 수
+    HTTP_POOL_LIMIT_PER_HOST: int = 16   # 호스트당 최대 연결 수 (BBox 조회 8개 레이어 동시 요청 수용)
+    HTTP_DNS_CACHE_TTL: int = 600        # seconds
+    HTTP_KEEPALIVE_TIMEOUT: float = 75.0 # seconds (유휴 연결 유지, 일반적인 서버 기본값과 동일)
+    
+    # ===== WFS 응답 캐시 설정 =====
+    # 설비 레이어 (전주/전선/변압기): 변경 가능성이 있어 짧은 TTL
+    WFS_CACHE_TTL_DYNAMIC: int = 300      # seconds (5분)
+    WFS_CACHE_SIZE_DYNAMIC: int = 100
+    # 기본도 레이어 (도로/건물/철도/하천/호수): 사실상 정적이므로 긴 TTL
+    WFS_CACHE_TTL_STATIC: int = 21600     # seconds (6시간)
+    WFS_CACHE_SIZE_STATIC: int = 200
+    # 빈 응답 (피처 없음/비 JSON 응답): 짧은 TTL로 반복 요청만 차단
+    WFS_CACHE_TTL_NEGATIVE: int = 60      # seconds
+    WFS_CACHE_SIZE_NEGATIVE: int = 500
+    # 디스크 캐시 디렉터리 (디버그 스크립트 반복 실행 시 프로세스 간 응답 재사용, 미설정 시 비활성)
+    WFS_DISK_CACHE_DIR: Optional[str] = None
+    # BBox 조회 타일 격자 (인접/중첩 뷰포트 요청을 타일 단위 캐시로 병합)
+    WFS_TILE_SIZE: float = 512.0          # meters
+    WFS_TILE_MAX_COUNT: int = 16          # 초과 시 타일 분할 없이 단일 요청
+    WFS_FANOUT_LIMIT: int = 4             # 레이어별 타일/페이지 동시 요청 수 (0이면 제한 없음)
+    # 중심 좌표 조회 BBox 스냅 격자 (바깥쪽 확장 조회 후 포함 BBox 캐시로 인접 클릭 재사용, 0이면 미확장)
+    WFS_CACHE_SNAP: float = 100.0         # meters
+    # 서버별 다중 Query 단일 요청 (WFS 1.1.0 다중 wfs:Query 지원 및
+    # 피처 ID 'typeName.' 접두어 응답 서버에서만 사용, 사용 시 타일 캐시 미적용)
+    WFS_BATCH_QUERIES: bool = False
+    # 대용량 BBox 페이지 분할 조회 (startIndex 지원 서버에서만 사용)
+    WFS_PAGING_ENABLED: bool = False
+    WFS_PAGE_SIZE: int = 1000
+    # 서버 기동 시 캐시 예열 범위 (기본 좌표 중심 (2r+1)x(2r+1) BBox 격자, 병렬 조회)
+    WARMUP_GRID_RADIUS: int = 1
+    WARMUP_TIMEOUT: float = 30.0          # seconds
     
     # ===== CORS 설정 =====
     # 허용할 오리진 목록 (쉼표로 구분)
@@ -16,7 +16,7 @@ import logging
 from app.config import settings
 from app.core.preprocessor import Road, Pole, Building, ProcessedData
 from app.core.target_selector import TargetPole
-from app.utils.coordinate import calculate_distance
+from app.utils.coordinate import calculate_distance, squared_distance
 from app.utils.profiler import profile, profile_block
 
 # R-tree 공간 인덱스 (선택적)
@@ -142,7 +142,7 @@ class SpatialIndex:
                 node_id = self.rtree_id_map.get(nearby[0])
                 if node_id and node_id in self.nodes:
                     node_coord = self.nodes[node_id]
-                    if calculate_distance(coord[0], coord[1], node_coord[0], node_coord[1]) < tolerance:
+                    if squared_distance(coord[0], coord[1], node_coord[0], node_coord[1]) < tolerance * tolerance:
                         return node_id
             return None
         
@@ -150,7 +150,10 @@ class SpatialIndex:
         grid_key = self._grid_key(coord)
         search_range = int(tolerance / self.precision) + 1
         
-        min_dist = float('inf')
+        # 제곱 거리로 비교 (제곱근/함수 호출 생략)
+        cx, cy = coord[0], coord[1]
+        tolerance_sq = tolerance * tolerance
+        min_dist_sq = float('inf')
         nearest_node = None
         
         for dx in range(-search_range, search_range + 1):
@@ -159,12 +162,11 @@ class SpatialIndex:
                 if check_key in self.grid:
                     for node_id in self.grid[check_key]:
                         node_coord = self.nodes[node_id]
-                        dist = calculate_distance(
-                            coord[0], coord[1],
-                            node_coord[0], node_coord[1]
-                        )
-                        if dist < tolerance and dist < min_dist:
-                            min_dist = dist
+                        ex = node_coord[0] - cx
+                        ey = node_coord[1] - cy
+                        dist_sq = ex * ex + ey * ey
+                        if dist_sq < tolerance_sq and dist_sq < min_dist_sq:
+                            min_dist_sq = dist_sq
                             nearest_node = node_id
         
         return nearest_node
@@ -185,6 +187,7 @@ class SpatialIndex:
             노드 ID 리스트
         """
         result = []
+        radius_sq = radius * radius
         
         # R-tree 사용 가능 시
         if self.rtree:
@@ -197,7 +200,7 @@ class SpatialIndex:
                 node_id = self.rtree_id_map.get(rtree_id)
                 if node_id and node_id in self.nodes:
                     node_coord = self.nodes[node_id]
-                    if calculate_distance(coord[0], coord[1], node_coord[0], node_coord[1]) <= radius:
+                    if squared_distance(coord[0], coord[1], node_coord[0], node_coord[1]) <= radius_sq:
                         result.append(node_id)
             return result
         
@@ -211,7 +214,7 @@ class SpatialIndex:
                 if check_key in self.grid:
                     for node_id in self.grid[check_key]:
                         node_coord = self.nodes[node_id]
-                        if calculate_distance(coord[0], coord[1], node_coord[0], node_coord[1]) <= radius:
+                        if squared_distance(coord[0], coord[1], node_coord[0], node_coord[1]) <= radius_sq:
                             result.append(node_id)
         
         return result
@@ -625,7 +628,7 @@ class RoadGraphBuilder:
                 # 외곽 방향 벡터
                 dx = coord[0] - center_x
                 dy = coord[1] - center_y
-                dist = math.sqrt(dx*dx + dy*dy)
+                dist = math.hypot(dx, dy)
                 if dist > 0:
                     dx /= dist
                     dy /= dist
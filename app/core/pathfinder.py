@@ -168,7 +168,7 @@ class Pathfinder:
         
         n1 = self.nodes[node_id].coord
         n2 = self.nodes[target_id].coord
-        h = math.sqrt((n2[0] - n1[0])**2 + (n2[1] - n1[1])**2)
+        h = math.hypot(n2[0] - n1[0], n2[1] - n1[1])
         
         self._heuristic_cache[cache_key] = h
         return h
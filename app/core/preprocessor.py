@@ -768,14 +768,14 @@ class DataPreprocessor:
             poles: 전주 리스트  
             max_distance: 연결 판정 최대 거리 (미터, 기본 15m)
         """
-        from app.utils.coordinate import calculate_distance
-        
         if not poles:
             return
         
         # 전주 좌표 맵 생성
         pole_coords = [(p.id, p.coord) for p in poles]
         
+        # 최근접 탐색은 제곱 거리로 비교 (제곱근/함수 호출 생략)
+        max_distance_sq = max_distance * max_distance
         linked_count = 0
         
         for line in lines:
@@ -792,15 +792,15 @@ class DataPreprocessor:
             
             # 시작점에서 가장 가까운 전주 찾기
             if not line.start_pole_id:
-                min_dist = float('inf')
+                min_dist_sq = float('inf')
                 nearest_pole_id = None
+                ex, ey = start_coord[0], start_coord[1]
                 for pole_id, pole_coord in pole_coords:
-                    dist = calculate_distance(
-                        start_coord[0], start_coord[1],
-                        pole_coord[0], pole_coord[1]
-                    )
-                    if dist < min_dist and dist <= max_distance:
-                        min_dist = dist
+                    ddx = pole_coord[0] - ex
+                    ddy = pole_coord[1] - ey
+                    dist_sq = ddx * ddx + ddy * ddy
+                    if dist_sq < min_dist_sq and dist_sq <= max_distance_sq:
+                        min_dist_sq = dist_sq
                         nearest_pole_id = pole_id
                 
                 if nearest_pole_id:
@@ -809,15 +809,15 @@ class DataPreprocessor:
             
             # 끝점에서 가장 가까운 전주 찾기
             if not line.end_pole_id:
-                min_dist = float('inf')
+                min_dist_sq = float('inf')
                 nearest_pole_id = None
+                ex, ey = end_coord[0], end_coord[1]
                 for pole_id, pole_coord in pole_coords:
-                    dist = calculate_distance(
-                        end_coord[0], end_coord[1],
-                        pole_coord[0], pole_coord[1]
-                    )
-                    if dist < min_dist and dist <= max_distance:
-                        min_dist = dist
+                    ddx = pole_coord[0] - ex
+                    ddy = pole_coord[1] - ey
+                    dist_sq = ddx * ddx + ddy * ddy
+                    if dist_sq < min_dist_sq and dist_sq <= max_distance_sq:
+                        min_dist_sq = dist_sq
                         nearest_pole_id = pole_id
                 
                 if nearest_pole_id:
@@ -837,12 +837,11 @@ class DataPreprocessor:
         변압기-전주 공간 연결 (Snapping)
         ID 링크가 없는 경우 좌표 기반으로 가장 가까운 전주에 변압기 할당
         """
-        from app.utils.coordinate import calculate_distance
-        
         if not transformers or not poles:
             return
             
         snap_dist = max_distance or settings.TRANSFORMER_SNAP_DISTANCE
+        snap_dist_sq = snap_dist * snap_dist
         linked_count = 0
         
         # 전주 좌표 맵 생성
@@ -853,16 +852,16 @@ class DataPreprocessor:
             if tr.pole_id:
                 continue
                 
-            min_dist = float('inf')
+            min_dist_sq = float('inf')
             nearest_pole = None
+            tx, ty = tr.coord[0], tr.coord[1]
             
             for p_id, p_coord, p_obj in pole_coords:
-                dist = calculate_distance(
-                    tr.coord[0], tr.coord[1],
-                    p_coord[0], p_coord[1]
-                )
-                if dist < min_dist and dist <= snap_dist:
-                    min_dist = dist
+                ddx = p_coord[0] - tx
+                ddy = p_coord[1] - ty
+                dist_sq = ddx * ddx + ddy * ddy
+                if dist_sq < min_dist_sq and dist_sq <= snap_dist_sq:
+                    min_dist_sq = dist_sq
                     nearest_pole = p_obj
             
             if nearest_pole:
@@ -4,19 +4,110 @@ ELBIX AIDD 후보 전주 선별기
 - Fast Track: 40m 이내 직접 연결 체크
 """
 
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Optional, Tuple
 from dataclasses import dataclass, field
-from shapely.geometry import Point, LineString
+import numpy as np
+import shapely
 
 from app.config import settings
-from app.core.preprocessor import Pole, Line, Building, ProcessedData
-from app.utils.coordinate import calculate_distance
+from app.core.preprocessor import Pole, Line, ProcessedData
 import logging
+import math
+
+# Numba JIT (선택적) - 미설치 시 NumPy 벡터 연산 사용
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
+# 상 코드 → 커널 입력값 (1: 단상, 3: 3상, 0: 보너스 없음)
+_PHASE_MODE = {"1": 1, "3": 3}
+
+
+def _score_and_filter_loop(px, py, cx, cy, matched, has_tx, has_lv, has_hv3, is_3p,
+                           phase_mode, max_sq, fast_sq):
+    """
+    거리/우선순위/Fast Track 후보 산출 커널 (Numba 컴파일 대상)
+    
+    거리 제한은 제곱 거리(max_sq, fast_sq)로 비교하고, 제곱근은 유지 대상만 계산
+    
+    Returns:
+        (priorities, dists, fast_track_mask, keep_mask) - dists는 유지 대상 외 inf
+    """
+    n = px.shape[0]
+    priorities = np.zeros(n, dtype=np.int64)
+    dists = np.full(n, np.inf)
+    fast_mask = np.zeros(n, dtype=np.bool_)
+    keep_mask = np.zeros(n, dtype=np.bool_)
+    
+    for i in range(n):
+        if not matched[i]:
+            continue
+        dx = px[i] - cx
+        dy = py[i] - cy
+        sq = dx * dx + dy * dy
+        if sq > max_sq:
+            continue
+        keep_mask[i] = True
+        d = math.sqrt(sq)
+        dists[i] = d
+        
+        # 기본 점수 = 직선 거리, 변압기/저압선/고압 3상 보너스 반영
+        score = d
+        if phase_mode == 1:
+            if has_tx[i]:
+                score -= 100.0
+            elif has_lv[i]:
+                score -= 50.0
+        elif phase_mode == 3:
+            if has_tx[i] and is_3p[i]:
+                score -= 150.0
+            elif has_hv3[i]:
+                score -= 100.0
+        priorities[i] = int(score)
+        
+        if sq <= fast_sq:
+            fast_mask[i] = True
+    
+    return priorities, dists, fast_mask, keep_mask
+
 
-@dataclass
+def _score_and_filter_numpy(px, py, cx, cy, matched, has_tx, has_lv, has_hv3, is_3p,
+                            phase_mode, max_sq, fast_sq):
+    """_score_and_filter_loop와 동일한 결과를 NumPy 벡터 연산으로 산출 (Numba 미설치 시)"""
+    dx = px - cx
+    dy = py - cy
+    sq = dx * dx + dy * dy
+    keep_mask = matched & (sq <= max_sq)
+    fast_mask = keep_mask & (sq <= fast_sq)
+    
+    # 제곱근 및 우선순위는 거리 필터를 통과한 전주에 대해서만 산출
+    keep_idx = np.flatnonzero(keep_mask)
+    dists = np.full(px.shape[0], np.inf)
+    dists[keep_idx] = np.sqrt(sq[keep_idx])
+    
+    score = dists[keep_idx]
+    if phase_mode == 1:
+        score = score - np.where(has_tx[keep_idx], 100.0, np.where(has_lv[keep_idx], 50.0, 0.0))
+    elif phase_mode == 3:
+        tx_3p = has_tx[keep_idx] & is_3p[keep_idx]
+        score = score - np.where(tx_3p, 150.0, np.where(has_hv3[keep_idx], 100.0, 0.0))
+    
+    priorities = np.zeros(px.shape[0], dtype=np.int64)
+    priorities[keep_idx] = score.astype(np.int64)
+    return priorities, dists, fast_mask, keep_mask
+
+
+if NUMBA_AVAILABLE:
+    _score_and_filter = njit(cache=True, fastmath=True)(_score_and_filter_loop)
+else:
+    _score_and_filter = _score_and_filter_numpy
+
+
+@dataclass(slots=True)
 class TargetPole:
     """후보 전주 (Target Pole)"""
     pole: Pole                          # 원본 전주 데이터
@@ -34,11 +125,12 @@ class TargetPole:
         return self.pole.coord
 
 
-@dataclass
+@dataclass(slots=True)
 class SelectionResult:
     """선별 결과"""
     targets: List[TargetPole]           # 후보 전주 목록 (우선순위 순)
     fast_track_targets: List[TargetPole] = field(default_factory=list) # [MOD] 다중 Fast Track 후보
+    fast_track_target: Optional[TargetPole] = None  # 최우선 Fast Track 후보
     consumer_coord: Tuple[float, float] = (0, 0)    # 수용가 좌표
     phase_code: str = ""                # 요청 상 코드
     message: str = ""                   # 결과 메시지
@@ -59,6 +151,17 @@ class TargetSelector:
         
         # 전주-전선 연결 관계 구축
         self._build_pole_line_map()
+        
+        # 전주 속성 SoA 배열 (거리/우선순위 벡터 연산용)
+        self._build_pole_arrays()
+        
+        # 거리 제한 (제곱 거리 비교용)
+        self._sqdist_max = settings.MAX_DISTANCE_LIMIT ** 2
+        self._sqdist_fast = settings.FAST_TRACK_DISTANCE ** 2
+        
+        # 건물 형상 및 bbox 배열 (B, 4) - 장애물 검사 1차 필터용
+        self._building_geoms = np.array([b.geometry for b in self.buildings], dtype=object)
+        self._building_bboxes = shapely.bounds(self._building_geoms).reshape(-1, 4)
     
     def _build_pole_line_map(self):
         """전주-전선 연결 관계 맵 생성"""
@@ -73,6 +176,35 @@ class TargetSelector:
                     self.pole_to_lines[line.end_pole_id] = []
                 self.pole_to_lines[line.end_pole_id].append(line)
     
+    def _build_pole_arrays(self):
+        """전주 좌표/속성을 연속 배열(SoA)로 변환"""
+        n = len(self.poles)
+        self._pole_x = np.fromiter((p.coord[0] for p in self.poles), dtype=np.float64, count=n)
+        self._pole_y = np.fromiter((p.coord[1] for p in self.poles), dtype=np.float64, count=n)
+        self._has_tx = np.fromiter((p.has_transformer for p in self.poles), dtype=bool, count=n)
+        self._is_3p = np.fromiter((p.is_three_phase for p in self.poles), dtype=bool, count=n)
+        
+        # 전주 ID → 인덱스 목록 (중복 ID 전주 모두 표시), 연결 전선 속성 마스크 (전선 1회 순회로 구축)
+        self._pole_id_to_idx: Dict[str, List[int]] = {}
+        for i, p in enumerate(self.poles):
+            self._pole_id_to_idx.setdefault(p.id, []).append(i)
+        self._connected_mask = np.zeros(n, dtype=bool)   # 전선 연결 전주
+        self._hv_mask = np.zeros(n, dtype=bool)          # 고압선 연결 전주
+        self._has_lv = np.zeros(n, dtype=bool)           # 저압선 연결 전주
+        self._has_hv3 = np.zeros(n, dtype=bool)          # 고압 3상선 연결 전주
+        for line in self.lines:
+            for pole_id in (line.start_pole_id, line.end_pole_id):
+                idx = self._pole_id_to_idx.get(pole_id) if pole_id else None
+                if not idx:
+                    continue
+                self._connected_mask[idx] = True
+                if line.line_type == "HV":
+                    self._hv_mask[idx] = True
+                    if line.phase_code == "3":
+                        self._has_hv3[idx] = True
+                else:
+                    self._has_lv[idx] = True
+    
     def _analyze_pole_connections(self, pole_id: str) -> Dict[str, bool]:
         """전주의 전선 연결 타입 분석"""
         result = {'has_lv': False, 'has_hv': False, 'has_hv_3phase': False}
@@ -89,49 +221,52 @@ class TargetSelector:
         return result
     
     def select(self, consumer_coord: Tuple[float, float], phase_code: str) -> SelectionResult:
-        """후보 전주 선별 메인 로직 (순정 상태)"""
+        """후보 전주 선별 메인 로직"""
         result = SelectionResult(targets=[], consumer_coord=consumer_coord, phase_code=phase_code)
         
         # 1. 상 매칭 (필터링)
-        matched_poles = self._phase_matching(phase_code)
-        if not matched_poles:
+        matched = self._phase_matching_mask(phase_code)
+        if not matched.any():
             return result
         
-        # 2. 거리 필터링 (400m)
-        target_poles = []
-        for pole in matched_poles:
-            dist = calculate_distance(consumer_coord[0], consumer_coord[1], pole.coord[0], pole.coord[1])
-            if dist <= settings.MAX_DISTANCE_LIMIT:
-                target_poles.append(TargetPole(pole=pole, distance_to_consumer=dist))
-        
-        # 3. 우선순위 및 Fast Track 체크 (자연스러운 가중치)
-        for target in target_poles:
-            # 기본 점수 = 직선 거리
-            score = target.distance_to_consumer
-            
-            # 공학적 보너스: 변압기나 저압선(LV)이 있으면 비용 절감 효과 반영 (약 50~100m 보너스)
-            conn = self._analyze_pole_connections(target.pole.id)
-            
-            if phase_code == "1":
-                if target.pole.has_transformer:
-                    score -= 100.0  # 변압기가 바로 있으면 최우선 (변압기 신설 필요 없음)
-                elif conn['has_lv']:
-                    score -= 50.0   # 저압선이라도 있으면 우선
-            elif phase_code == "3":
-                if target.pole.has_transformer and target.pole.is_three_phase:
-                    score -= 150.0  # 3상 변압기가 있으면 최우선
-                elif conn['has_hv_3phase']:
-                    score -= 100.0  # 고압 3상이라도 있으면 우선
-            
-            target.priority = int(score)
+        # 2. 거리 필터링 (400m, 제곱 거리 비교) + 우선순위 산출 (컴파일된 커널)
+        priorities, dists, fast_mask, keep_mask = _score_and_filter(
+            self._pole_x, self._pole_y,
+            float(consumer_coord[0]), float(consumer_coord[1]),
+            matched, self._has_tx, self._has_lv, self._has_hv3, self._is_3p,
+            _PHASE_MODE.get(phase_code, 0),
+            float(self._sqdist_max), float(self._sqdist_fast)
+        )
+        candidate_idx = np.flatnonzero(keep_mask)
+        
+        # 3. 후보 생성
+        target_poles = [
+            TargetPole(
+                pole=self.poles[i],
+                distance_to_consumer=float(dists[i]),
+                priority=int(priorities[i])
+            )
+            for i in candidate_idx
+        ]
+        
+        # Fast Track 체크 (40m 이내, 장애물 없을 시) - 직선 일괄 생성 후 일괄 검사
+        fast_pos = np.flatnonzero(fast_mask[candidate_idx])
+        if len(fast_pos):
+            fast_idx = candidate_idx[fast_pos]
+            segments = np.empty((len(fast_idx), 2, 2), dtype=np.float64)
+            segments[:, 0, 0] = consumer_coord[0]
+            segments[:, 0, 1] = consumer_coord[1]
+            segments[:, 1, 0] = self._pole_x[fast_idx]
+            segments[:, 1, 1] = self._pole_y[fast_idx]
+            direct_lines = shapely.linestrings(segments)
+            blocked = self._check_obstacles_bulk(direct_lines)
             
-            # Fast Track 체크 (40m 이내, 장애물 없을 시)
-            if target.distance_to_consumer <= settings.FAST_TRACK_DISTANCE:
-                if not self._check_obstacle(consumer_coord, target.coord):
-                    target.is_fast_track = True
+            for pos, is_blocked in zip(fast_pos, blocked):
+                target_poles[pos].is_fast_track = not is_blocked
 
-        # 4. 최종 정렬
-        target_poles.sort(key=lambda t: (t.priority, t.distance_to_consumer))
+        # 4. 최종 정렬 (우선순위 → 거리, 배열 기반 안정 정렬)
+        order = np.lexsort((dists[candidate_idx], priorities[candidate_idx]))
+        target_poles = [target_poles[i] for i in order]
         
         result.targets = target_poles
         if target_poles and target_poles[0].is_fast_track:
@@ -140,28 +275,60 @@ class TargetSelector:
         return result
 
     def _phase_matching(self, phase_code: str) -> List[Pole]:
+        return [self.poles[i] for i in np.flatnonzero(self._phase_matching_mask(phase_code))]
+
+    def _phase_matching_mask(self, phase_code: str) -> np.ndarray:
+        """상 매칭 결과를 self.poles 인덱스 기준 bool 마스크로 반환"""
         if phase_code == "3":
-            return self._get_three_phase_connected_poles()
-        else:
-            return self._get_single_phase_connectable_poles()
+            return self._hv_mask
+        return self._connected_mask
 
     def _get_single_phase_connectable_poles(self) -> List[Pole]:
-        connected_pole_ids = {line.start_pole_id for line in self.lines if line.start_pole_id}
-        connected_pole_ids.update({line.end_pole_id for line in self.lines if line.end_pole_id})
-        return [p for p in self.poles if p.id in connected_pole_ids]
+        return [self.poles[i] for i in np.flatnonzero(self._connected_mask)]
 
     def _get_three_phase_connected_poles(self) -> List[Pole]:
-        hv_connected_ids = set()
-        for line in self.lines:
-            if line.line_type == "HV":
-                if line.start_pole_id: hv_connected_ids.add(line.start_pole_id)
-                if line.end_pole_id: hv_connected_ids.add(line.end_pole_id)
-        return [p for p in self.poles if p.id in hv_connected_ids]
-
-    def _check_obstacle(self, start: Tuple[float, float], end: Tuple[float, float]) -> bool:
-        if not self.buildings: return False
-        line = LineString([start, end])
-        for building in self.buildings:
-            if line.intersects(building.geometry) and not line.touches(building.geometry):
-                return True
-        return False
+        return [self.poles[i] for i in np.flatnonzero(self._hv_mask)]
+
+    def _check_obstacles_bulk(self, lines: np.ndarray) -> np.ndarray:
+        """
+        직선 배열의 건물 관통 여부 일괄 검사
+        
+        bbox 중첩 검사로 후보 (직선, 건물) 쌍을 먼저 추린 뒤 해당 쌍만 정밀 검사.
+        건물과 교차하되 경계 접촉만 하는 경우는 장애물로 보지 않음
+        
+        Returns:
+            직선별 장애물 존재 여부 (bool 배열)
+        """
+        blocked = np.zeros(len(lines), dtype=bool)
+        if not self.buildings or len(lines) == 0:
+            return blocked
+        
+        # 1차: 전체 직선 영역과 겹치는 건물만 선별 (대부분의 건물 제외)
+        seg_bounds = shapely.bounds(lines)
+        min_x, min_y = seg_bounds[:, 0].min(), seg_bounds[:, 1].min()
+        max_x, max_y = seg_bounds[:, 2].max(), seg_bounds[:, 3].max()
+        b_min_x, b_min_y, b_max_x, b_max_y = self._building_bboxes.T
+        near = np.flatnonzero(
+            (b_max_x >= min_x) & (b_min_x <= max_x) & (b_max_y >= min_y) & (b_min_y <= max_y)
+        )
+        if not len(near):
+            return blocked
+        
+        # 2차: 직선별 bbox 중첩 쌍 산출
+        near_bboxes = self._building_bboxes[near]
+        overlap = (
+            (near_bboxes[None, :, 2] >= seg_bounds[:, None, 0]) &
+            (near_bboxes[None, :, 0] <= seg_bounds[:, None, 2]) &
+            (near_bboxes[None, :, 3] >= seg_bounds[:, None, 1]) &
+            (near_bboxes[None, :, 1] <= seg_bounds[:, None, 3])
+        )
+        line_idx, near_pos = np.nonzero(overlap)
+        if not len(line_idx):
+            return blocked
+        
+        # 3차: 중첩 쌍만 GEOS 정밀 검사
+        pair_lines = lines[line_idx]
+        pair_buildings = self._building_geoms[near[near_pos]]
+        crossing = shapely.intersects(pair_lines, pair_buildings) & ~shapely.touches(pair_lines, pair_buildings)
+        blocked[line_idx[crossing]] = True
+        return blocked
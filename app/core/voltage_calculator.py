@@ -10,18 +10,25 @@ from dataclasses import dataclass
 from enum import Enum
 import logging
 
+import numpy as np
+
 from app.config import settings
 
 logger = logging.getLogger(__name__)
 
+SQRT3 = math.sqrt(3)
+
 
 class WireType(Enum):
-    """전선 종류"""
+    """전선 종류 (index: 저항/리액턴스 배열 인덱스)"""
     ACSR_58 = "ACSR_58"
     ACSR_95 = "ACSR_95"
     ACSR_160 = "ACSR_160"
     OW_22 = "OW_22"
     OW_38 = "OW_38"
+    
+    def __init__(self, value: str):
+        self.index = len(self.__class__.__members__)
 
 
 # 전선 저항/리액턴스 매핑 (Ω/km)
@@ -41,8 +48,30 @@ WIRE_REACTANCE = {
     WireType.OW_38: settings.WIRE_REACTANCE_OW_38,
 }
 
+# WireType.index 기준 저항/리액턴스 조회 배열 (Ω/km)
+_WIRE_R = np.array([WIRE_RESISTANCE[wt] for wt in WireType], dtype=np.float64)
+_WIRE_X = np.array([WIRE_REACTANCE[wt] for wt in WireType], dtype=np.float64)
+
+# 전선 추천 순서 (작은 규격부터)
+RECOMMEND_WIRE_ORDER = (
+    WireType.OW_22,
+    WireType.OW_38,
+    WireType.ACSR_58,
+    WireType.ACSR_95,
+    WireType.ACSR_160,
+)
+_RECOMMEND_IDX = np.array([wt.index for wt in RECOMMEND_WIRE_ORDER], dtype=np.intp)
+
+# 일괄 계산 결과 (구조화 배열) 필드 정의
+VOLTAGE_DROP_DTYPE = np.dtype([
+    ("load_current", np.float64),          # 부하 전류 (A)
+    ("voltage_drop_v", np.float64),        # 전압 강하 (V)
+    ("voltage_drop_percent", np.float64),  # 전압 강하율 (%)
+    ("is_acceptable", np.bool_),           # 허용 범위 내 여부
+])
 
-@dataclass
+
+@dataclass(slots=True)
 class VoltageDropResult:
     """전압 강하 계산 결과"""
     # 입력 값
@@ -83,6 +112,61 @@ class VoltageCalculator:
         self.voltage_lv = voltage_lv or settings.NOMINAL_VOLTAGE_LV
         self.voltage_lv_3p = voltage_lv_3p or settings.NOMINAL_VOLTAGE_LV_3P
         self.voltage_hv = voltage_hv or settings.NOMINAL_VOLTAGE_HV
+        
+        # 역률 관련 계수 사전 계산 (호출마다 삼각함수 재계산 방지)
+        self._sin_theta = math.sqrt(1 - self.power_factor ** 2)
+        
+        # 전선별 임피던스 성분 (R×cosθ + X×sinθ, Ω/km) - WireType.index 기준
+        self._z_component = _WIRE_R * self.power_factor + _WIRE_X * self._sin_theta
+        self._z_recommend = self._z_component[_RECOMMEND_IDX]
+        
+        # 부하 전류 계수 (I = P[kW] × coeff)
+        self._current_coeff_1p = 1000 / (self.voltage_lv * self.power_factor)
+        self._current_coeff_3p = 1000 / (SQRT3 * self.voltage_lv_3p * self.power_factor)
+        self._current_coeff_hv_1p = 1000 / (self.voltage_hv * self.power_factor)
+        self._current_coeff_hv_3p = 1000 / (SQRT3 * self.voltage_hv * self.power_factor)
+    
+    def _get_z_component(self, wire_type: WireType) -> float:
+        """전선별 임피던스 성분 조회"""
+        return float(self._z_component[wire_type.index])
+    
+    def _resolve_voltage(
+        self,
+        phase_type: str,
+        is_high_voltage: bool = False,
+        voltage_override: float = None
+    ) -> Tuple[float, float]:
+        """공칭 전압 및 허용 전압 강하 한계 결정 → (전압 V, 한계 %)"""
+        if voltage_override is not None and voltage_override > 0:
+            # 전압 레벨에 따른 허용 한계 자동 설정
+            if voltage_override >= 1000:
+                return voltage_override, settings.VOLTAGE_DROP_LIMIT_HV
+            return voltage_override, settings.VOLTAGE_DROP_LIMIT_LV
+        if is_high_voltage:
+            return self.voltage_hv, settings.VOLTAGE_DROP_LIMIT_HV
+        if phase_type == "3":
+            return self.voltage_lv_3p, settings.VOLTAGE_DROP_LIMIT_LV
+        return self.voltage_lv, settings.VOLTAGE_DROP_LIMIT_LV
+    
+    def _get_current_coeff(
+        self,
+        phase_type: str,
+        is_high_voltage: bool,
+        voltage_override: float = None
+    ) -> float:
+        """
+        부하 전류 계수 조회
+        
+        voltage_override(실제 전압값)가 있으면 해당 전압으로 계산하고,
+        그 외에는 사전 계산된 계수를 사용
+        """
+        if voltage_override is not None and voltage_override > 0:
+            if phase_type == "3":
+                return 1000 / (SQRT3 * voltage_override * self.power_factor)
+            return 1000 / (voltage_override * self.power_factor)
+        if is_high_voltage:
+            return self._current_coeff_hv_3p if phase_type == "3" else self._current_coeff_hv_1p
+        return self._current_coeff_3p if phase_type == "3" else self._current_coeff_1p
     
     def calculate(
         self,
@@ -111,46 +195,20 @@ class VoltageCalculator:
             전압 강하 계산 결과
         """
         # 전압 결정
-        if voltage_override is not None and voltage_override > 0:
-            nominal_voltage = voltage_override
-            # 전압 레벨에 따른 허용 한계 자동 설정
-            if nominal_voltage >= 1000:
-                limit_percent = settings.VOLTAGE_DROP_LIMIT_HV
-            else:
-                limit_percent = settings.VOLTAGE_DROP_LIMIT_LV
-        elif is_high_voltage:
-            nominal_voltage = self.voltage_hv
-            limit_percent = settings.VOLTAGE_DROP_LIMIT_HV
-        elif phase_type == "3":
-            nominal_voltage = self.voltage_lv_3p
-            limit_percent = settings.VOLTAGE_DROP_LIMIT_LV
-        else:
-            nominal_voltage = self.voltage_lv
-            limit_percent = settings.VOLTAGE_DROP_LIMIT_LV
+        nominal_voltage, limit_percent = self._resolve_voltage(phase_type, is_high_voltage, voltage_override)
         
         # 부하 전류 계산 (I = P / (V × cosθ × √3) for 3상, I = P / (V × cosθ) for 단상)
-        if phase_type == "3":
-            load_current = (load_kw * 1000) / (math.sqrt(3) * nominal_voltage * self.power_factor)
-        else:
-            load_current = (load_kw * 1000) / (nominal_voltage * self.power_factor)
+        load_current = load_kw * self._get_current_coeff(phase_type, is_high_voltage, voltage_override)
         
-        # 저항/리액턴스 (Ω/km)
-        resistance = WIRE_RESISTANCE.get(wire_type, settings.WIRE_RESISTANCE_OW_22)
-        reactance = WIRE_REACTANCE.get(wire_type, settings.WIRE_REACTANCE_OW_22)
+        # 임피던스 성분 (R×cosθ + X×sinθ)
+        z_component = self._get_z_component(wire_type)
         
         # 거리 (km로 변환)
         distance_km = distance / 1000.0
         
-        # 역률 관련 계수
-        cos_theta = self.power_factor
-        sin_theta = math.sqrt(1 - cos_theta ** 2)
-        
-        # 임피던스 성분
-        z_component = resistance * cos_theta + reactance * sin_theta
-        
         # 전압 강하 계산 (V)
         if phase_type == "3":
-            voltage_drop_v = math.sqrt(3) * load_current * z_component * distance_km
+            voltage_drop_v = SQRT3 * load_current * z_component * distance_km
         else:
             voltage_drop_v = 2 * load_current * z_component * distance_km
         
@@ -166,10 +224,11 @@ class VoltageCalculator:
         else:
             message = f"전압 강하 {voltage_drop_percent:.2f}% - 한계 초과! (한계: {limit_percent}%)"
         
-        logger.info(
-            f"전압 강하 계산: {distance:.1f}m, {load_kw}kW, {phase_type}상, "
-            f"{wire_type.value} → {voltage_drop_percent:.2f}% ({message})"
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                f"전압 강하 계산: {distance:.1f}m, {load_kw}kW, {phase_type}상, "
+                f"{wire_type.value} → {voltage_drop_percent:.2f}% ({message})"
+            )
         
         return VoltageDropResult(
             distance=distance,
@@ -184,6 +243,48 @@ class VoltageCalculator:
             message=message
         )
     
+    def calculate_many(
+        self,
+        distances: np.ndarray,
+        loads_kw: np.ndarray,
+        phase_type: str = "1",
+        wire_type: WireType = WireType.OW_22,
+        is_high_voltage: bool = False
+    ) -> np.ndarray:
+        """
+        전압 강하 일괄 계산 (N개 거리/부하 쌍 벡터 연산)
+        
+        calculate()와 동일한 공식을 사용하며, 값은 반올림하지 않음.
+        
+        Args:
+            distances: 거리 배열 (m)
+            loads_kw: 부하 용량 배열 (kW, 스칼라 가능 - 브로드캐스팅)
+            phase_type: 상 타입 ("1": 단상, "3": 3상)
+            wire_type: 전선 종류
+            is_high_voltage: 고압 여부
+        
+        Returns:
+            VOLTAGE_DROP_DTYPE 구조화 배열
+            (load_current, voltage_drop_v, voltage_drop_percent, is_acceptable)
+        """
+        distances, loads_kw = np.broadcast_arrays(
+            np.asarray(distances, dtype=np.float64),
+            np.asarray(loads_kw, dtype=np.float64)
+        )
+        
+        nominal_voltage, limit_percent = self._resolve_voltage(phase_type, is_high_voltage)
+        k = SQRT3 if phase_type == "3" else 2
+        
+        result = np.empty(distances.shape, dtype=VOLTAGE_DROP_DTYPE)
+        result["load_current"] = loads_kw * self._get_current_coeff(phase_type, is_high_voltage)
+        result["voltage_drop_v"] = (
+            k * result["load_current"] * self._get_z_component(wire_type) * (distances / 1000.0)
+        )
+        result["voltage_drop_percent"] = (result["voltage_drop_v"] / nominal_voltage) * 100
+        result["is_acceptable"] = result["voltage_drop_percent"] <= limit_percent
+        
+        return result
+    
     def calculate_max_distance(
         self,
         load_kw: float,
@@ -221,34 +322,27 @@ class VoltageCalculator:
             nominal_voltage = self.voltage_lv
         
         # 부하 전류 계산
-        if phase_type == "3":
-            load_current = (load_kw * 1000) / (math.sqrt(3) * nominal_voltage * self.power_factor)
-        else:
-            load_current = (load_kw * 1000) / (nominal_voltage * self.power_factor)
+        load_current = load_kw * self._get_current_coeff(phase_type, is_high_voltage)
         
-        # 저항/리액턴스
-        resistance = WIRE_RESISTANCE.get(wire_type, settings.WIRE_RESISTANCE_OW_22)
-        reactance = WIRE_REACTANCE.get(wire_type, settings.WIRE_REACTANCE_OW_22)
-        
-        cos_theta = self.power_factor
-        sin_theta = math.sqrt(1 - cos_theta ** 2)
-        z_component = resistance * cos_theta + reactance * sin_theta
+        # 임피던스 성분
+        z_component = self._get_z_component(wire_type)
         
         # 최대 허용 전압 강하 (V)
         max_drop_v = (max_drop_percent / 100) * nominal_voltage
         
         # 최대 거리 계산 (km)
         if phase_type == "3":
-            max_distance_km = max_drop_v / (math.sqrt(3) * load_current * z_component)
+            max_distance_km = max_drop_v / (SQRT3 * load_current * z_component)
         else:
             max_distance_km = max_drop_v / (2 * load_current * z_component)
         
         # m로 변환
         max_distance_m = max_distance_km * 1000
         
-        logger.info(
-            f"최대 허용 거리: {load_kw}kW, {phase_type}상, {wire_type.value} → {max_distance_m:.1f}m"
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                f"최대 허용 거리: {load_kw}kW, {phase_type}상, {wire_type.value} → {max_distance_m:.1f}m"
+            )
         
         return round(max_distance_m, 1)
     
@@ -269,23 +363,23 @@ class VoltageCalculator:
         Returns:
             (추천 전선 종류, 전압 강하 결과)
         """
-        # 규격 순서 (작은 것부터)
-        wire_order = [
-            WireType.OW_22,
-            WireType.OW_38,
-            WireType.ACSR_58,
-            WireType.ACSR_95,
-            WireType.ACSR_160,
-        ]
-        
-        for wire_type in wire_order:
+        # 전체 규격의 전압 강하율을 한 번에 계산 (규격 순서: 작은 것부터)
+        nominal_voltage, limit_percent = self._resolve_voltage(phase_type)
+        load_current = load_kw * self._get_current_coeff(phase_type, False)
+        k = SQRT3 if phase_type == "3" else 2
+        
+        voltage_drop_v = k * load_current * self._z_recommend * (distance / 1000.0)
+        voltage_drop_percent = (voltage_drop_v / nominal_voltage) * 100
+        acceptable = voltage_drop_percent <= limit_percent
+        
+        if acceptable.any():
+            wire_type = RECOMMEND_WIRE_ORDER[int(np.argmax(acceptable))]
             result = self.calculate(distance, load_kw, phase_type, wire_type)
-            if result.is_acceptable:
-                logger.info(f"전선 추천: {wire_type.value} (전압 강하 {result.voltage_drop_percent}%)")
-                return wire_type, result
+            logger.info(f"전선 추천: {wire_type.value} (전압 강하 {result.voltage_drop_percent}%)")
+            return wire_type, result
         
         # 모든 규격에서 초과 시 최대 규격 반환
-        largest_wire = WireType.ACSR_160
+        largest_wire = RECOMMEND_WIRE_ORDER[-1]
         result = self.calculate(distance, load_kw, phase_type, largest_wire)
         logger.warning(f"모든 전선 규격에서 전압 강하 초과: {largest_wire.value} 사용 권장")
         return largest_wire, result
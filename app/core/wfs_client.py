@@ -3,17 +3,44 @@ ELBIX AIDD WFS 클라이언트
 - GetFeature 요청을 통한 GIS 데이터 수집
 - 비동기 HTTP 클라이언트 사용
 - 연결 풀링 및 응답 캐싱 적용
+- 운영 환경은 uvloop 이벤트 루프 기준 (연결 풀 크기 설정 전제)
 """
 
-import httpx
 import aiohttp
-from typing import List, Dict, Any, Optional, Tuple, ClassVar
+import asyncio
+from typing import List, Dict, Any, Optional, Tuple, ClassVar, Union
 from dataclasses import dataclass
 import json
 import logging
+import math
+import os
+import time
 import hashlib
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
 import threading
-from cachetools import TTLCache
+from cachetools import LRUCache, TTLCache
+
+# orjson (선택적) - 미설치 시 표준 json 사용
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# pysimdjson (선택적) - orjson 미설치 시 features 배열만 지연 파싱
+try:
+    import simdjson
+    SIMDJSON_AVAILABLE = True
+except ImportError:
+    SIMDJSON_AVAILABLE = False
+
+# Brotli (선택적) - 설치 시 br 압축 응답 요청 (aiohttp가 자동 해제)
+try:
+    import brotli  # noqa: F401
+    BROTLI_AVAILABLE = True
+except ImportError:
+    BROTLI_AVAILABLE = False
 
 from app.config import settings
 from app.utils.coordinate import calculate_bbox
@@ -21,60 +48,237 @@ from app.utils.profiler import profile_async
 
 logger = logging.getLogger(__name__)
 
+# 응답 본문 수신 청크 크기 (bytes)
+_READ_CHUNK_SIZE = 65536
+
+# GetFeature 요청 헤더 (GeoJSON 응답 gzip/deflate/br 압축 전송 요청)
+_REQUEST_HEADERS_GZIP = {
+    "Content-Type": "text/xml",
+    "Accept": "application/json",
+    "Accept-Encoding": "gzip, deflate, br" if BROTLI_AVAILABLE else "gzip, deflate",
+}
+_REQUEST_HEADERS_IDENTITY = {**_REQUEST_HEADERS_GZIP, "Accept-Encoding": "identity"}
+
+# 대용량 응답 JSON 파싱 스레드 풀 (이 크기 이상이면 이벤트 루프 밖에서 파싱)
+_PARSE_OFFLOAD_BYTES = 256 * 1024
+_PARSE_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix="wfs-parse")
+
+# JSON 디코더 (bytes 직접 파싱)
+_json_loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+_json_dumps = orjson.dumps if ORJSON_AVAILABLE else (lambda obj: json.dumps(obj).encode())
+
+# simdjson 파서는 내부 버퍼 재사용을 위해 스레드별로 유지
+_simdjson_local = threading.local()
+
+
+def _get_simdjson_parser() -> "simdjson.Parser":
+    parser = getattr(_simdjson_local, "parser", None)
+    if parser is None:
+        parser = _simdjson_local.parser = simdjson.Parser()
+    return parser
+
+
+def _is_json_payload(buf: bytearray) -> bool:
+    """선행 공백을 제외한 첫 바이트로 JSON 여부 판별 (본문 전체 복사 없음)"""
+    return buf[:64].lstrip()[:1] in (b'{', b'[')
+
+
+def parse_features(raw: Union[bytes, bytearray]) -> List[Dict[str, Any]]:
+    """
+    WFS JSON 응답에서 피처 목록 추출
+    
+    피처 dict 생성 비용이 파싱 시간 대부분을 차지하므로 orjson 전체 파싱을 우선 사용
+    (5000 피처 기준 orjson 전체 파싱이 simdjson features 배열 변환보다 빠름).
+    orjson 미설치 시 simdjson으로 features 배열만 Python 객체로 변환
+    """
+    if SIMDJSON_AVAILABLE and not ORJSON_AVAILABLE:
+        doc = features = None
+        try:
+            doc = _get_simdjson_parser().parse(raw)
+            if isinstance(doc, simdjson.Array):
+                return doc.as_list()
+            if isinstance(doc, simdjson.Object) and "features" in doc:
+                features = doc["features"]
+                if isinstance(features, simdjson.Array):
+                    return features.as_list()
+                if isinstance(features, simdjson.Object):
+                    return features.as_dict()
+                return features
+            return []
+        finally:
+            # 파서 재사용 전 지연 객체 참조 해제 필요
+            del doc, features
+    
+    data = _json_loads(raw)
+    # GeoJSON FeatureCollection 형식 파싱
+    if isinstance(data, dict) and "features" in data:
+        return data["features"]
+    elif isinstance(data, list):
+        return data
+    return []
+
+
+# 캐시 키: (URL, 레이어, 10m 격자 인덱스 min_x, min_y, max_x, max_y)
+#         또는 타일 키 (URL, 레이어, 타일 x, 타일 y, 타일 크기, 최대 피처 수)
+CacheKey = Tuple[Any, ...]
+
 
 class WFSCache:
     """
-    WFS 응답 캐싱 (Thread-safe)
+    WFS 응답 캐싱
     
-    - TTL 기반 캐시 (기본 5분)
+    - TTL 기반 캐시 (설비 레이어 5분, 기본도 레이어 6시간, 빈 응답 1분)
     - 좌표 기반 캐시 키 생성
+    - 조회/저장은 이벤트 루프 단일 스레드에서 수행되므로 잠금 없이 처리
+    - WFS_DISK_CACHE_DIR 설정 시 비어 있지 않은 응답을 디스크에도 저장 (개발/디버그용)
+    - 전역 인스턴스는 get_wfs_cache()로 접근
     """
     
-    _instance = None
-    _lock = threading.Lock()
+    # 정적 캐시 대상 레이어 (기본도)
+    STATIC_LAYERS: ClassVar[frozenset] = frozenset({"road", "building", "railway", "river", "lake"})
     
-    def __new__(cls):
-        if cls._instance is None:
-            with cls._lock:
-                if cls._instance is None:
-                    cls._instance = super().__new__(cls)
-                    # maxsize=100, ttl=300초 (5분)
-                    cls._instance._cache = TTLCache(maxsize=100, ttl=300)
-                    cls._instance._hits = 0
-                    cls._instance._misses = 0
-        return cls._instance
+    def __init__(self):
+        self._dynamic = TTLCache(maxsize=settings.WFS_CACHE_SIZE_DYNAMIC, ttl=settings.WFS_CACHE_TTL_DYNAMIC)
+        self._static = TTLCache(maxsize=settings.WFS_CACHE_SIZE_STATIC, ttl=settings.WFS_CACHE_TTL_STATIC)
+        self._negative = TTLCache(maxsize=settings.WFS_CACHE_SIZE_NEGATIVE, ttl=settings.WFS_CACHE_TTL_NEGATIVE)
+        # 포함 조회용 캐시 항목별 실제 BBox (잘리지 않은 응답만 등록, (URL, 레이어)별 분리)
+        self._extents: Dict[Tuple[str, str], Dict[CacheKey, Tuple[float, float, float, float]]] = {}
+        # (URL, 레이어)별 최근 잘리지 않은 응답의 피처 밀도 (개/㎡, 스냅 확장 여부 판단용)
+        self._density: Dict[Tuple[str, str], float] = {}
+        self._disk_dir = os.path.expanduser(settings.WFS_DISK_CACHE_DIR) if settings.WFS_DISK_CACHE_DIR else None
+        self._hits = 0
+        self._misses = 0
+    
+    @classmethod
+    def generate_key(cls, url: str, bbox: Tuple[float, float, float, float], layer: str) -> CacheKey:
+        """
+        캐시 키 생성 (BBox 좌표를 10m 격자 정수 인덱스로 양자화)
+        
+        해시 다이제스트 대신 튜플을 그대로 키로 사용 (문자열 조립/인코딩 없음, 충돌 없음)
+        """
+        min_x, min_y, max_x, max_y = bbox
+        return (url, layer, int(min_x) // 10, int(min_y) // 10, int(max_x) // 10, int(max_y) // 10)
     
     @classmethod
-    def generate_key(cls, url: str, bbox: Tuple[float, float, float, float], layer: str) -> str:
-        """캐시 키 생성 (BBox 좌표를 정수로 반올림하여 키 생성)"""
-        # 좌표를 미터 단위로 반올림 (10m 단위)
-        rounded_bbox = tuple(round(c / 10) * 10 for c in bbox)
-        key_str = f"{url}:{layer}:{rounded_bbox}"
-        return hashlib.md5(key_str.encode()).hexdigest()
-    
-    def get(self, key: str) -> Optional[List[Dict[str, Any]]]:
-        """캐시에서 데이터 조회"""
-        with self._lock:
-            result = self._cache.get(key)
+    def generate_tile_key(cls, url: str, layer: str, tx: int, ty: int, tile_size: float, max_features: int) -> CacheKey:
+        """타일 캐시 키 생성"""
+        return (url, layer, tx, ty, tile_size, max_features)
+    
+    def _cache_for(self, key: CacheKey) -> TTLCache:
+        """키의 레이어에 따라 정적/동적 캐시 선택"""
+        return self._static if key[1] in self.STATIC_LAYERS else self._dynamic
+    
+    def _disk_path(self, key: CacheKey) -> str:
+        """디스크 캐시 파일 경로 (키 repr 해시, 프로세스 간 동일)"""
+        digest = hashlib.sha1(repr(key).encode()).hexdigest()
+        return os.path.join(self._disk_dir, f"wfs_{digest}.json")
+    
+    def _disk_get(self, key: CacheKey) -> Optional[List[Dict[str, Any]]]:
+        """디스크 캐시 조회 (레이어별 메모리 캐시와 같은 TTL을 파일 수정 시각 기준으로 적용)"""
+        path = self._disk_path(key)
+        ttl = settings.WFS_CACHE_TTL_STATIC if key[1] in self.STATIC_LAYERS else settings.WFS_CACHE_TTL_DYNAMIC
+        try:
+            if time.time() - os.path.getmtime(path) > ttl:
+                return None
+            with open(path, "rb") as f:
+                return _json_loads(f.read())
+        except (OSError, ValueError):
+            return None
+    
+    def _disk_set(self, key: CacheKey, data: List[Dict[str, Any]]):
+        """디스크 캐시 저장 (임시 파일 작성 후 교체하여 부분 기록 방지)"""
+        path = self._disk_path(key)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(self._disk_dir, exist_ok=True)
+            with open(tmp_path, "wb") as f:
+                f.write(_json_dumps(data))
+            os.replace(tmp_path, path)
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning(f"WFS 디스크 캐시 저장 실패: {e}")
+    
+    def get(self, key: CacheKey, record_miss: bool = True) -> Optional[List[Dict[str, Any]]]:
+        """
+        캐시에서 데이터 조회 (빈 응답 캐시 우선, 메모리 미스 시 디스크 캐시)
+        
+        record_miss=False 이면 미스를 통계에 집계하지 않음 (이후 같은 키를 다시 조회하는 사전 확인용)
+        """
+        result = self._negative.get(key)
+        if result is None:
+            result = self._cache_for(key).get(key)
+        if result is None and self._disk_dir:
+            result = self._disk_get(key)
             if result is not None:
-                self._hits += 1
-                logger.debug(f"[Cache HIT] key={key[:8]}...")
-            else:
-                self._misses += 1
-            return result
+                self._cache_for(key)[key] = result
+        if result is not None:
+            self._hits += 1
+            logger.debug(f"[Cache HIT] layer={key[1]}")
+        elif record_miss:
+            self._misses += 1
+        return result
+    
+    def get_covering(
+        self,
+        url: str,
+        layer: str,
+        bbox: Tuple[float, float, float, float]
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        요청 BBox를 포함하는 캐시 항목 조회 (만료 항목은 BBox 목록에서 정리)
+        
+        반환 피처는 저장 BBox 기준이므로 호출 측에서 요청 BBox로 필터링 필요
+        """
+        extents = self._extents.get((url, layer))
+        if not extents:
+            return None
+        min_x, min_y, max_x, max_y = bbox
+        result = None
+        for key, extent in list(extents.items()):
+            data = self._negative.get(key)
+            if data is None:
+                data = self._cache_for(key).get(key)
+            if data is None:
+                del extents[key]
+                continue
+            if (result is None and extent[0] <= min_x and extent[1] <= min_y
+                    and extent[2] >= max_x and extent[3] >= max_y):
+                result = data
+        if result is not None:
+            self._hits += 1
+            logger.debug(f"[Cache HIT] layer={layer} (포함 BBox)")
+        return result
     
-    def set(self, key: str, data: List[Dict[str, Any]]):
-        """캐시에 데이터 저장"""
-        with self._lock:
-            self._cache[key] = data
-            logger.debug(f"[Cache SET] key={key[:8]}..., items={len(data)}")
+    def set_extent(self, key: CacheKey, bbox: Tuple[float, float, float, float], count: int):
+        """캐시 항목의 실제 BBox 및 피처 수 등록 (get_covering 대상, 레이어 밀도 갱신)"""
+        self._extents.setdefault((key[0], key[1]), {})[key] = bbox
+        area = (bbox[2] - bbox[0]) * (bbox[3] - bbox[1])
+        if area > 0:
+            self._density[(key[0], key[1])] = count / area
+    
+    def density(self, url: str, layer: str) -> Optional[float]:
+        """레이어의 최근 피처 밀도 (개/㎡, 기록 없으면 None)"""
+        return self._density.get((url, layer))
+    
+    def set(self, key: CacheKey, data: List[Dict[str, Any]]):
+        """캐시에 데이터 저장 (빈 결과는 짧은 TTL 캐시에 저장)"""
+        if data:
+            self._negative.pop(key, None)
+            self._cache_for(key)[key] = data
+            if self._disk_dir:
+                self._disk_set(key, data)
+        else:
+            self._negative[key] = data
+        logger.debug(f"[Cache SET] layer={key[1]}, items={len(data)}")
     
     def clear(self):
         """캐시 초기화"""
-        with self._lock:
-            self._cache.clear()
-            self._hits = 0
-            self._misses = 0
+        self._dynamic.clear()
+        self._static.clear()
+        self._negative.clear()
+        self._extents.clear()
+        self._density.clear()
+        self._hits = 0
+        self._misses = 0
     
     @property
     def stats(self) -> Dict[str, Any]:
@@ -85,63 +289,94 @@ class WFSCache:
             "hits": self._hits,
             "misses": self._misses,
             "hit_rate": f"{hit_rate:.1f}%",
-            "size": len(self._cache)
+            "size": len(self._dynamic) + len(self._static) + len(self._negative),
+            "dynamic_size": len(self._dynamic),
+            "static_size": len(self._static),
+            "negative_size": len(self._negative)
         }
 
 
-class WFSConnectionPool:
+# 전역 캐시 인스턴스 (모듈 싱글톤)
+_wfs_cache = WFSCache()
+
+# 공유 HTTP 세션 (모듈 싱글톤, 최초 요청 시 생성)
+_wfs_session: Optional[aiohttp.ClientSession] = None
+
+
+def get_wfs_cache() -> WFSCache:
+    """전역 WFS 응답 캐시 반환"""
+    return _wfs_cache
+
+
+async def get_wfs_session() -> aiohttp.ClientSession:
     """
-    WFS 연결 풀 관리 (Singleton)
+    공유 세션 반환 (없으면 생성)
     
     - aiohttp ClientSession 재사용
     - TCPConnector로 연결 수 제한
     """
+    global _wfs_session
+    if _wfs_session is None or _wfs_session.closed:
+        connector = aiohttp.TCPConnector(
+            limit=settings.HTTP_POOL_LIMIT,                    # 최대 동시 연결 수
+            limit_per_host=settings.HTTP_POOL_LIMIT_PER_HOST,  # 호스트당 최대 연결 수
+            use_dns_cache=True,
+            ttl_dns_cache=settings.HTTP_DNS_CACHE_TTL,         # DNS 조회 결과 캐시
+            happy_eyeballs_delay=0.1,
+            keepalive_timeout=settings.HTTP_KEEPALIVE_TIMEOUT,  # Keep-alive 타임아웃
+            force_close=False,
+            enable_cleanup_closed=False  # 유휴 만료 후 풀 연결 유실 방지
+        )
+        timeout = aiohttp.ClientTimeout(total=settings.HTTP_TIMEOUT)
+        _wfs_session = aiohttp.ClientSession(
+            connector=connector,
+            timeout=timeout
+        )
+        logger.info(
+            f"WFS 연결 풀 생성: limit={settings.HTTP_POOL_LIMIT}, "
+            f"limit_per_host={settings.HTTP_POOL_LIMIT_PER_HOST}, keepalive={settings.HTTP_KEEPALIVE_TIMEOUT:g}s"
+        )
+    return _wfs_session
+
+
+async def warmup_wfs_session(urls: List[str]) -> int:
+    """
+    연결 풀 예열 (서버 기동 시)
     
-    _instance = None
-    _lock = threading.Lock()
-    _session: Optional[aiohttp.ClientSession] = None
+    WFS 서버별 HEAD 요청을 동시에 보내 DNS 조회/TCP 연결을 미리 수립.
+    응답 상태와 무관하게 연결만 풀에 남기며 오류는 무시
     
-    def __new__(cls):
-        if cls._instance is None:
-            with cls._lock:
-                if cls._instance is None:
-                    cls._instance = super().__new__(cls)
-        return cls._instance
+    Returns:
+        연결에 성공한 서버 수
+    """
+    session = await get_wfs_session()
+    timeout = aiohttp.ClientTimeout(total=5)
     
-    @classmethod
-    async def get_session(cls) -> aiohttp.ClientSession:
-        """공유 세션 반환 (없으면 생성)"""
-        if cls._session is None or cls._session.closed:
-            connector = aiohttp.TCPConnector(
-                limit=10,              # 최대 동시 연결 수
-                limit_per_host=5,      # 호스트당 최대 연결 수
-                keepalive_timeout=30,  # Keep-alive 타임아웃
-                enable_cleanup_closed=True
-            )
-            timeout = aiohttp.ClientTimeout(total=settings.HTTP_TIMEOUT)
-            cls._session = aiohttp.ClientSession(
-                connector=connector,
-                timeout=timeout
-            )
-            logger.info("WFS 연결 풀 생성: limit=10, keepalive=30s")
-        return cls._session
+    async def ping(url: str):
+        async with session.head(url, timeout=timeout, allow_redirects=False) as response:
+            # 응답 완료 처리해야 연결이 풀로 반환됨
+            await response.read()
     
-    @classmethod
-    async def close(cls):
-        """세션 종료"""
-        if cls._session and not cls._session.closed:
-            await cls._session.close()
-            cls._session = None
-            logger.info("WFS 연결 풀 종료")
+    unique_urls = list(dict.fromkeys(urls))
+    results = await asyncio.gather(*(ping(url) for url in unique_urls), return_exceptions=True)
+    for url, result in zip(unique_urls, results):
+        if isinstance(result, Exception):
+            logger.warning(f"WFS 연결 풀 예열 실패 (무시): {url} ({result!r})")
+    return sum(1 for result in results if not isinstance(result, Exception))
 
 
-# 전역 캐시 인스턴스
-_wfs_cache = WFSCache()
+async def close_wfs_session():
+    """공유 세션 종료"""
+    global _wfs_session
+    if _wfs_session and not _wfs_session.closed:
+        await _wfs_session.close()
+        _wfs_session = None
+        logger.info("WFS 연결 풀 종료")
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class WFSLayer:
-    """WFS 레이어 정보"""
+    """WFS 레이어 정보 (불변)"""
     name: str           # 레이어명
     geometry_field: str  # 지오메트리 필드명
     wfs_url: str        # WFS 서버 URL
@@ -199,67 +434,351 @@ BASE_LAYERS = {
     ),
 }
 
-# 레이어별 필수 필드 리스트 (가시성 및 분석용)
+# 레이어별 필수 필드 (가시성 및 분석용, 불변 튜플)
 LAYER_PROPS = {
-    "pole": ["GID", "POLE_ID", "POLE_FORM_CD", "POLE_KND_CD", "POLE_SPEC_CD", "FAC_STAT_CD", "LINE_NO", "LINE_NM"],
-    "line_hv": ["GID", "PRWR_KND_CD", "PHAR_CLCD", "VOLT_VAL", "FAC_STAT_CD", "LWER_FAC_GID", "UPPO_FAC_GID", "TEXT_GIS_ANNXN"],
-    "line_lv": ["GID", "PRWR_KND_CD", "PHAR_CLCD", "VOLT_VAL", "FAC_STAT_CD", "LWER_FAC_GID", "UPPO_FAC_GID", "TEXT_GIS_ANNXN"],
-    "transformer": ["GID", "TEXT_GIS_ANNXN", "PHAR_CLCD", "FAC_STAT_CD", "CAP_KVA", "TR_TYPE", "LVW_KND_CD", "NEWI_KND_CD", "POLE_ID"],
-    "road": ["ROAD_ID", "FTR_IDN", "ROAD_TYPE"],
-    "building": ["BLDG_ID", "FTR_IDN", "BLDG_TYPE"]
+    "pole": ("GID", "POLE_ID", "POLE_FORM_CD", "POLE_KND_CD", "POLE_SPEC_CD", "FAC_STAT_CD", "LINE_NO", "LINE_NM"),
+    "line_hv": ("GID", "PRWR_KND_CD", "PHAR_CLCD", "VOLT_VAL", "FAC_STAT_CD", "LWER_FAC_GID", "UPPO_FAC_GID", "TEXT_GIS_ANNXN"),
+    "line_lv": ("GID", "PRWR_KND_CD", "PHAR_CLCD", "VOLT_VAL", "FAC_STAT_CD", "LWER_FAC_GID", "UPPO_FAC_GID", "TEXT_GIS_ANNXN"),
+    "transformer": ("GID", "TEXT_GIS_ANNXN", "PHAR_CLCD", "FAC_STAT_CD", "CAP_KVA", "TR_TYPE", "LVW_KND_CD", "NEWI_KND_CD", "POLE_ID"),
+    "road": ("ROAD_ID", "FTR_IDN", "ROAD_TYPE"),
+    "building": ("BLDG_ID", "FTR_IDN", "BLDG_TYPE"),
 }
 
+# 페이지 조회 정렬 기준 필드 (레이어별 고유 ID, 정렬 없는 startIndex 페이지는 서버 순서에 따라 누락/중복 발생)
+# 고유 ID를 알 수 없는 레이어는 페이지 분할 없이 단일 요청
+LAYER_SORT_KEYS = {
+    "pole": "GID",
+    "line_hv": "GID",
+    "line_lv": "GID",
+    "transformer": "GID",
+    "road": "ROAD_ID",
+    "building": "BLDG_ID",
+}
 
-def build_getfeature_xml(
-    layer_name: str,
-    geometry_field: str,
-    bbox: Tuple[float, float, float, float],
-    srs_name: str = "EPSG:3857",
-    max_features: int = 1000,
-    property_names: List[str] = None
-) -> str:
+
+async def gather_or_cancel(*coros, limit: int = 0) -> List[Any]:
     """
-    WFS GetFeature 요청 XML 생성 (필드 필터링 지원)
+    코루틴 동시 실행 (asyncio.TaskGroup)
+    
+    하나라도 실패하면 나머지 요청을 즉시 취소하고 첫 번째 예외를 그대로 전파
+    (호출부의 기존 예외 처리 유지를 위해 ExceptionGroup은 해제).
+    limit > 0 이면 동시 실행 수를 제한 (단일 호출의 연결 풀 독점 방지)
     """
-    min_x, min_y, max_x, max_y = bbox
+    if 0 < limit < len(coros):
+        semaphore = asyncio.Semaphore(limit)
+        
+        async def bounded(coro):
+            async with semaphore:
+                return await coro
+        
+        coros = tuple(bounded(coro) for coro in coros)
     
-    # 필드 선별 로직 추가 (데이터 전송량 최적화)
-    props_xml = ""
-    if property_names:
-        # 지오메트리 필드 강제 포함
-        final_props = set(property_names)
-        final_props.add(geometry_field)
-        props_xml = "".join([f'<wfs:PropertyName>{p}</wfs:PropertyName>' for p in final_props])
-    
-    xml = f'''<?xml version="1.0" encoding="UTF-8"?>
+    try:
+        async with asyncio.TaskGroup() as tg:
+            tasks = [tg.create_task(coro) for coro in coros]
+    except BaseExceptionGroup as eg:
+        if len(eg.exceptions) > 1:
+            logger.warning(f"동시 요청 중 {len(eg.exceptions)}건 실패, 첫 번째 오류 전파")
+        raise eg.exceptions[0] from None
+    return [task.result() for task in tasks]
+
+
+def tile_range(bbox: Tuple[float, float, float, float], tile_size: float) -> List[Tuple[int, int]]:
+    """BBox를 덮는 타일 인덱스 목록 (고정 격자)"""
+    min_x, min_y, max_x, max_y = bbox
+    tx0, tx1 = math.floor(min_x / tile_size), math.floor(max_x / tile_size)
+    ty0, ty1 = math.floor(min_y / tile_size), math.floor(max_y / tile_size)
+    return [(tx, ty) for ty in range(ty0, ty1 + 1) for tx in range(tx0, tx1 + 1)]
+
+
+def _coords_bounds(coords, bounds: List[float]):
+    """중첩 좌표 배열의 최소/최대 좌표 갱신"""
+    if coords and isinstance(coords[0], (int, float)):
+        x, y = coords[0], coords[1]
+        if x < bounds[0]: bounds[0] = x
+        if y < bounds[1]: bounds[1] = y
+        if x > bounds[2]: bounds[2] = x
+        if y > bounds[3]: bounds[3] = y
+        return
+    for c in coords:
+        _coords_bounds(c, bounds)
+
+
+def feature_bounds(feature: Dict[str, Any]) -> Optional[Tuple[float, float, float, float]]:
+    """피처 지오메트리 외곽 사각형 (지오메트리 없으면 None)"""
+    geometry = feature.get("geometry")
+    if geometry and "coordinates" in geometry:
+        bounds = [math.inf, math.inf, -math.inf, -math.inf]
+        _coords_bounds(geometry["coordinates"], bounds)
+        if bounds[0] != math.inf:
+            return tuple(bounds)
+    return None
+
+
+# 피처 목록별 외곽 사각형 (id(목록) -> (목록, 외곽 사각형 목록))
+# 캐시된 피처 dict는 호출부에 그대로 반환되므로 내부 키를 쓰지 않고 별도 보관.
+# 목록 참조를 함께 보관하여 id 재사용을 막고, 크기 제한으로 만료된 캐시 목록은 밀려남
+_BOUNDS_MEMO: LRUCache = LRUCache(maxsize=1024)
+
+
+def features_bounds(features: List[Dict[str, Any]]) -> List[Optional[Tuple[float, float, float, float]]]:
+    """피처 목록의 외곽 사각형 목록 (동일 목록은 최초 1회만 계산)"""
+    entry = _BOUNDS_MEMO.get(id(features))
+    if entry is not None and entry[0] is features and len(entry[1]) == len(features):
+        return entry[1]
+    bounds = [feature_bounds(feature) for feature in features]
+    _BOUNDS_MEMO[id(features)] = (features, bounds)
+    return bounds
+
+
+def _bounds_in_bbox(
+    bounds: Optional[Tuple[float, float, float, float]],
+    bbox: Tuple[float, float, float, float]
+) -> bool:
+    """외곽 사각형이 BBox와 겹치는지 여부 (지오메트리 없으면 포함)"""
+    if bounds is None:
+        return True
+    return bounds[2] >= bbox[0] and bounds[0] <= bbox[2] and bounds[3] >= bbox[1] and bounds[1] <= bbox[3]
+
+
+def filter_features_in_bbox(
+    features: List[Dict[str, Any]],
+    bbox: Tuple[float, float, float, float]
+) -> List[Dict[str, Any]]:
+    """BBox와 겹치는 피처만 선별 (외곽 사각형은 목록 단위로 재사용)"""
+    return [f for f, b in zip(features, features_bounds(features)) if _bounds_in_bbox(b, bbox)]
+
+
+def snap_bbox(bbox: Tuple[float, float, float, float], grid: float) -> Tuple[float, float, float, float]:
+    """BBox를 격자 단위로 바깥쪽 확장 (grid <= 0이면 그대로)"""
+    if grid <= 0:
+        return bbox
+    min_x, min_y, max_x, max_y = bbox
+    return (
+        math.floor(min_x / grid) * grid,
+        math.floor(min_y / grid) * grid,
+        math.ceil(max_x / grid) * grid,
+        math.ceil(max_y / grid) * grid,
+    )
+
+
+def merge_tile_features(
+    tiles: List[List[Dict[str, Any]]],
+    bbox: Tuple[float, float, float, float],
+    max_features: int
+) -> List[Dict[str, Any]]:
+    """타일별 피처 병합 (피처 ID 기준 중복 제거 + 요청 BBox 필터링)"""
+    merged = []
+    seen = set()
+    for features in tiles:
+        for feature, bounds in zip(features, features_bounds(features)):
+            fid = feature.get("id")
+            if fid is not None:
+                if fid in seen:
+                    continue
+                seen.add(fid)
+            if _bounds_in_bbox(bounds, bbox):
+                merged.append(feature)
+                if len(merged) >= max_features:
+                    return merged
+    return merged
+
+
+# 응답 형식 (파싱 경로가 GeoJSON만 지원하므로 기본값 고정)
+GEOJSON_OUTPUT_FORMAT = "application/json"
+
+# GetFeature 요청 XML 템플릿 (UTF-8 bytes, 요청마다 값만 치환)
+_GETFEATURE_HEADER = b'''<?xml version="1.0" encoding="UTF-8"?>
 <wfs:GetFeature
     service="WFS"
     version="1.1.0"
-    maxFeatures="{max_features}"
-    outputFormat="application/json"
+    maxFeatures="%d"
+    outputFormat="%b"
     xmlns:wfs="http://www.opengis.net/wfs"
     xmlns:ogc="http://www.opengis.net/ogc"
     xmlns:gml="http://www.opengis.net/gml">
-    <wfs:Query typeName="{layer_name}" srsName="{srs_name}">
-        {props_xml}
+'''
+_GETFEATURE_QUERY = b'''    <wfs:Query typeName="%b" srsName="%b">
+        %b
         <ogc:Filter>
             <ogc:BBOX>
-                <ogc:PropertyName>{geometry_field}</ogc:PropertyName>
-                <gml:Envelope srsName="{srs_name}">
-                    <gml:lowerCorner>{min_x} {min_y}</gml:lowerCorner>
-                    <gml:upperCorner>{max_x} {max_y}</gml:upperCorner>
+                <ogc:PropertyName>%b</ogc:PropertyName>
+                <gml:Envelope srsName="%b">
+                    <gml:lowerCorner>%b %b</gml:lowerCorner>
+                    <gml:upperCorner>%b %b</gml:upperCorner>
                 </gml:Envelope>
             </ogc:BBOX>
         </ogc:Filter>
     </wfs:Query>
-</wfs:GetFeature>'''
+'''
+_GETFEATURE_FOOTER = b'</wfs:GetFeature>'
+# 페이지 조회용 정렬 (Filter 뒤에 위치)
+_SORT_BY_XML = b'''</ogc:Filter>
+        <ogc:SortBy>
+            <ogc:SortProperty>
+                <ogc:PropertyName>%b</ogc:PropertyName>
+                <ogc:SortOrder>ASC</ogc:SortOrder>
+            </ogc:SortProperty>
+        </ogc:SortBy>'''
+
+
+@lru_cache(maxsize=64)
+def _property_names_xml(property_names: Tuple[str, ...], geometry_field: str) -> bytes:
+    """PropertyName 목록 XML (레이어별 고정값이므로 캐시)"""
+    # 지오메트리 필드 강제 포함 (순서 유지 중복 제거)
+    final_props = dict.fromkeys(property_names + (geometry_field,))
+    return "".join(f'<wfs:PropertyName>{p}</wfs:PropertyName>' for p in final_props).encode()
+
+
+def build_getfeature_xml(
+    layer_name: str,
+    geometry_field: str,
+    bbox: Tuple[float, float, float, float],
+    srs_name: str = "EPSG:3857",
+    max_features: int = 1000,
+    property_names: List[str] = None,
+    output_format: str = GEOJSON_OUTPUT_FORMAT
+) -> bytes:
+    """
+    WFS GetFeature 요청 XML 생성 (필드 필터링 지원)
+    
+    Returns:
+        UTF-8 인코딩된 요청 본문 (그대로 POST 가능)
+    """
+    return b"".join((
+        _GETFEATURE_HEADER % (max_features, output_format.encode()),
+        _build_query_xml(layer_name, geometry_field, bbox, srs_name, property_names),
+        _GETFEATURE_FOOTER
+    ))
+
+
+def build_getfeature_xml_multi(
+    queries: List[Tuple[WFSLayer, Optional[List[str]]]],
+    bbox: Tuple[float, float, float, float],
+    srs_name: str = "EPSG:3857",
+    max_features: int = 1000,
+    output_format: str = GEOJSON_OUTPUT_FORMAT
+) -> bytes:
+    """
+    여러 레이어를 하나의 GetFeature 요청으로 묶은 XML 생성 (WFS 1.1.0 다중 Query)
+    
+    Args:
+        queries: (레이어, 조회 필드 목록) 리스트
+        max_features: 요청 전체 최대 피처 수 (WFS 1.1.0에서는 전체 Query 합산 기준)
+    """
+    parts = [_GETFEATURE_HEADER % (max_features, output_format.encode())]
+    for layer, property_names in queries:
+        parts.append(_build_query_xml(layer.name, layer.geometry_field, bbox, srs_name, property_names))
+    parts.append(_GETFEATURE_FOOTER)
+    return b"".join(parts)
+
+
+def _build_query_xml(
+    layer_name: str,
+    geometry_field: str,
+    bbox: Tuple[float, float, float, float],
+    srs_name: str,
+    property_names: Optional[List[str]]
+) -> bytes:
+    """단일 wfs:Query 요소 XML"""
+    min_x, min_y, max_x, max_y = bbox
+    
+    # 필드 선별 로직 추가 (데이터 전송량 최적화)
+    props_xml = _property_names_xml(tuple(property_names), geometry_field) if property_names else b""
+    
+    srs = srs_name.encode()
+    return _GETFEATURE_QUERY % (
+        layer_name.encode(), srs, props_xml, geometry_field.encode(), srs,
+        str(min_x).encode(), str(min_y).encode(), str(max_x).encode(), str(max_y).encode()
+    )
+
+
+def split_features_by_layer(
+    features: List[Dict[str, Any]],
+    layer_names: List[str]
+) -> Optional[Dict[str, List[Dict[str, Any]]]]:
+    """
+    다중 Query 응답 피처를 레이어별로 분리 (피처 ID의 'typeName.' 접두어 기준)
+    
+    접두어가 일치하지 않는 피처가 하나라도 있으면 None 반환
+    (서버가 다른 ID 형식을 쓰는 경우 피처 누락 방지, 호출부에서 레이어별 재요청)
+    """
+    result: Dict[str, List[Dict[str, Any]]] = {name: [] for name in layer_names}
+    # 긴 레이어명 우선 매칭 (접두어 중첩 대비)
+    prefixes = sorted(((name + ".", name) for name in layer_names), key=lambda p: -len(p[0]))
+    unmatched = 0
+    for feature in features:
+        fid = feature.get("id") or ""
+        for prefix, name in prefixes:
+            if fid.startswith(prefix):
+                result[name].append(feature)
+                break
+        else:
+            unmatched += 1
+    if unmatched:
+        logger.warning(f"다중 Query 응답 중 레이어 식별 불가 피처 {unmatched}개")
+        return None
+    return result
+
+
+def _build_layer_template(
+    layer: WFSLayer,
+    property_names: Optional[List[str]],
+    srs_name: str = "EPSG:3857",
+    output_format: str = GEOJSON_OUTPUT_FORMAT
+) -> bytes:
+    """레이어 고정값(레이어명/지오메트리 필드/조회 필드/좌표계/응답 형식)을 미리 채운 요청 템플릿"""
+    escape = lambda b: b.replace(b"%", b"%%")
+    header = _GETFEATURE_HEADER.replace(b"%b", escape(output_format.encode()))
+    props_xml = _property_names_xml(tuple(property_names), layer.geometry_field) if property_names else b""
+    srs = escape(srs_name.encode())
+    query = _GETFEATURE_QUERY % (
+        escape(layer.name.encode()), srs, escape(props_xml), escape(layer.geometry_field.encode()), srs,
+        b"%b", b"%b", b"%b", b"%b"
+    )
+    return header + query + _GETFEATURE_FOOTER
+
+
+# 레이어별 GetFeature 요청 템플릿 (요청마다 maxFeatures와 BBox 좌표만 치환)
+_LAYER_XML_TEMPLATES: Dict[str, bytes] = {
+    key: _build_layer_template(layer, LAYER_PROPS.get(key))
+    for key, layer in {**GIS_LAYERS, **BASE_LAYERS}.items()
+}
+
+
+def build_layer_xml(
+    layer_key: str,
+    bbox: Tuple[float, float, float, float],
+    max_features: int = 1000,
+    start_index: Optional[int] = None
+) -> bytes:
+    """
+    레이어 키 기준 GetFeature 요청 XML 생성 (LAYER_PROPS 필드 필터링 적용)
     
+    build_getfeature_xml과 동일한 본문을 사전 생성 템플릿으로 생성.
+    start_index 지정 시 페이지 조회용 startIndex 속성과 LAYER_SORT_KEYS 기준 SortBy 추가
+    (정렬 필드가 없는 레이어는 KeyError)
+    """
+    min_x, min_y, max_x, max_y = bbox
+    xml = _LAYER_XML_TEMPLATES[layer_key] % (
+        max_features, str(min_x).encode(), str(min_y).encode(), str(max_x).encode(), str(max_y).encode()
+    )
+    if start_index is not None:
+        xml = xml.replace(b'maxFeatures="', b'startIndex="%d" maxFeatures="' % start_index, 1)
+        xml = xml.replace(b'</ogc:Filter>', _SORT_BY_XML % LAYER_SORT_KEYS[layer_key].encode(), 1)
     return xml
 
 
 class WFSClient:
     """WFS 데이터 수집 클라이언트 (연결 풀링 + 캐싱 + 필드 최적화)"""
     
+    # 압축 응답 해제에 실패한 서버 URL (비압축 요청으로 전환)
+    _identity_urls: ClassVar[set] = set()
+    
+    # 진행 중인 캐시 대상 요청 (동일 키 동시 요청은 하나의 요청 결과 공유)
+    _inflight: ClassVar[Dict[CacheKey, "asyncio.Task"]] = {}
+    _inflight_waiters: ClassVar[Dict[CacheKey, int]] = {}
+    
     def __init__(
         self,
         gis_wfs_url: str = None,
@@ -280,52 +799,90 @@ class WFSClient:
     async def _fetch_features(
         self,
         url: str,
-        xml_body: str,
-        cache_key: str = None
+        xml_body: bytes,
+        cache_key: CacheKey = None
     ) -> List[Dict[str, Any]]:
         """
         WFS GetFeature 요청 실행 (연결 풀 + 캐싱)
+        
+        캐시 미스 시 동일 캐시 키로 진행 중인 요청이 있으면 새로 요청하지 않고 그 결과를 공유.
+        대기자가 모두 취소되면 공유 요청도 취소
         """
+        if not (cache_key and self.use_cache):
+            return await self._request_features(url, xml_body, None)
+        
         # 캐시 확인
-        if cache_key and self.use_cache:
-            cached = self.cache.get(cache_key)
-            if cached is not None:
-                return cached
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            return cached
         
-        headers = {
-            "Content-Type": "text/xml",
-            "Accept": "application/json",
-            # "Accept-Encoding": "gzip, deflate", # 압축 해제 오류로 인해 비활성화
-        }
+        task = self._inflight.get(cache_key)
+        if task is None:
+            task = asyncio.ensure_future(self._request_features(url, xml_body, cache_key))
+            self._inflight[cache_key] = task
+            self._inflight_waiters[cache_key] = 0
+            task.add_done_callback(lambda _: self._release_inflight(cache_key, task))
         
+        self._inflight_waiters[cache_key] += 1
+        try:
+            return await asyncio.shield(task)
+        finally:
+            if self._inflight.get(cache_key) is task:
+                self._inflight_waiters[cache_key] -= 1
+                if self._inflight_waiters[cache_key] == 0 and not task.done():
+                    # 취소 중인 요청에 새 호출자가 합류하지 않도록 먼저 등록 해제
+                    self._release_inflight(cache_key, task)
+                    task.cancel()
+    
+    @classmethod
+    def _release_inflight(cls, cache_key: CacheKey, task: "asyncio.Task"):
+        """완료된 공유 요청 정리"""
+        if cls._inflight.get(cache_key) is task:
+            del cls._inflight[cache_key]
+            del cls._inflight_waiters[cache_key]
+    
+    async def _request_features(
+        self,
+        url: str,
+        xml_body: bytes,
+        cache_key: Optional[CacheKey]
+    ) -> List[Dict[str, Any]]:
+        """GetFeature 요청/파싱 후 캐시 저장 (cache_key 없으면 저장 생략)"""
         try:
             # 연결 풀에서 세션 가져오기
-            session = await WFSConnectionPool.get_session()
+            session = await get_wfs_session()
             
-            async with session.post(url, data=xml_body, headers=headers) as response:
-                response.raise_for_status()
-                text = await response.text()
-                
-                # JSON 파싱 시도
-                if text.strip().startswith('{') or text.strip().startswith('['):
-                    data = json.loads(text)
-                    
-                    # GeoJSON FeatureCollection 형식 파싱
-                    if isinstance(data, dict) and "features" in data:
-                        result = data["features"]
-                    elif isinstance(data, list):
-                        result = data
-                    else:
-                        result = []
-                    
-                    # 캐시에 저장
-                    if cache_key and self.use_cache:
-                        self.cache.set(cache_key, result)
-                    
-                    return result
+            if url in self._identity_urls:
+                raw = await self._post(session, url, xml_body, compress=False)
+            else:
+                try:
+                    raw = await self._post(session, url, xml_body, compress=True)
+                except aiohttp.ClientPayloadError as e:
+                    # 압축 해제 실패 서버는 이후 비압축 요청으로 전환
+                    logger.warning(f"WFS 압축 응답 해제 실패, 비압축 재요청: {url} ({e})")
+                    self._identity_urls.add(url)
+                    raw = await self._post(session, url, xml_body, compress=False)
+            
+            # JSON 파싱 시도 (연결 반환 후 버퍼 그대로 디코딩)
+            if _is_json_payload(raw):
+                if len(raw) >= _PARSE_OFFLOAD_BYTES:
+                    # 대용량 응답은 파싱 스레드에서 처리 (이벤트 루프 블로킹 방지)
+                    loop = asyncio.get_running_loop()
+                    result = await loop.run_in_executor(_PARSE_POOL, parse_features, raw)
                 else:
-                    logger.warning(f"WFS 응답이 JSON 형식이 아닙니다: {text[:200]}")
-                    return []
+                    result = parse_features(raw)
+                
+                # 캐시에 저장
+                if cache_key:
+                    self.cache.set(cache_key, result)
+                
+                return result
+            else:
+                logger.warning(f"WFS 응답이 JSON 형식이 아닙니다: {bytes(raw[:200]).decode('utf-8', 'replace')}")
+                # 빈 결과로 짧게 캐시 (동일 요청 반복 방지)
+                if cache_key:
+                    self.cache.set(cache_key, [])
+                return []
                     
         except aiohttp.ClientResponseError as e:
             logger.error(f"WFS HTTP 오류: {e}")
@@ -334,6 +891,23 @@ class WFSClient:
             logger.error(f"WFS 요청 오류: {e}")
             raise
     
+    async def _post(
+        self,
+        session: aiohttp.ClientSession,
+        url: str,
+        xml_body: bytes,
+        compress: bool
+    ) -> bytearray:
+        """GetFeature POST 후 응답 본문 수신"""
+        headers = _REQUEST_HEADERS_GZIP if compress else _REQUEST_HEADERS_IDENTITY
+        async with session.post(url, data=xml_body, headers=headers) as response:
+            response.raise_for_status()
+            # 본문을 청크 단위로 단일 버퍼에 수신 (str 디코딩/중간 복사 없음, gzip은 aiohttp가 해제)
+            raw = bytearray()
+            async for chunk in response.content.iter_chunked(_READ_CHUNK_SIZE):
+                raw.extend(chunk)
+        return raw
+    
     def get_cache_stats(self) -> Dict[str, Any]:
         """캐시 통계 반환"""
         return self.cache.stats
@@ -345,7 +919,11 @@ class WFSClient:
     @classmethod
     async def close_pool(cls):
         """연결 풀 종료"""
-        await WFSConnectionPool.close()
+        await close_wfs_session()
+    
+    async def warmup_pool(self) -> int:
+        """GIS/BASE WFS 서버 연결 풀 예열"""
+        return await warmup_wfs_session([self.gis_wfs_url, self.base_wfs_url])
     
     @profile_async
     async def get_poles(
@@ -356,16 +934,7 @@ class WFSClient:
     ) -> List[Dict[str, Any]]:
         """전주 데이터 조회"""
         bbox = calculate_bbox(center_x, center_y, bbox_size or settings.BBOX_SIZE)
-        layer = GIS_LAYERS["pole"]
-        cache_key = WFSCache.generate_key(self.gis_wfs_url, bbox, "pole")
-        
-        xml = build_getfeature_xml(
-            layer_name=layer.name,
-            geometry_field=layer.geometry_field,
-            bbox=bbox,
-            property_names=LAYER_PROPS["pole"]
-        )
-        return await self._fetch_features(self.gis_wfs_url, xml, cache_key)
+        return await self._fetch_layer_snapped(self.gis_wfs_url, "pole", bbox)
     
     @profile_async
     async def get_lines_hv(
@@ -376,16 +945,7 @@ class WFSClient:
     ) -> List[Dict[str, Any]]:
         """고압전선 데이터 조회"""
         bbox = calculate_bbox(center_x, center_y, bbox_size or settings.BBOX_SIZE)
-        layer = GIS_LAYERS["line_hv"]
-        cache_key = WFSCache.generate_key(self.gis_wfs_url, bbox, "line_hv")
-        
-        xml = build_getfeature_xml(
-            layer_name=layer.name,
-            geometry_field=layer.geometry_field,
-            bbox=bbox,
-            property_names=LAYER_PROPS["line_hv"]
-        )
-        return await self._fetch_features(self.gis_wfs_url, xml, cache_key)
+        return await self._fetch_layer_snapped(self.gis_wfs_url, "line_hv", bbox)
 
     @profile_async
     async def get_lines_lv(
@@ -396,16 +956,7 @@ class WFSClient:
     ) -> List[Dict[str, Any]]:
         """저압전선 데이터 조회"""
         bbox = calculate_bbox(center_x, center_y, bbox_size or settings.BBOX_SIZE)
-        layer = GIS_LAYERS["line_lv"]
-        cache_key = WFSCache.generate_key(self.gis_wfs_url, bbox, "line_lv")
-        
-        xml = build_getfeature_xml(
-            layer_name=layer.name,
-            geometry_field=layer.geometry_field,
-            bbox=bbox,
-            property_names=LAYER_PROPS["line_lv"]
-        )
-        return await self._fetch_features(self.gis_wfs_url, xml, cache_key)
+        return await self._fetch_layer_snapped(self.gis_wfs_url, "line_lv", bbox)
     
     @profile_async
     async def get_roads(
@@ -416,16 +967,7 @@ class WFSClient:
     ) -> List[Dict[str, Any]]:
         """도로 데이터 조회"""
         bbox = calculate_bbox(center_x, center_y, bbox_size or settings.BBOX_SIZE)
-        layer = BASE_LAYERS["road"]
-        cache_key = WFSCache.generate_key(self.base_wfs_url, bbox, "road")
-        
-        xml = build_getfeature_xml(
-            layer_name=layer.name,
-            geometry_field=layer.geometry_field,
-            bbox=bbox,
-            property_names=LAYER_PROPS["road"]
-        )
-        return await self._fetch_features(self.base_wfs_url, xml, cache_key)
+        return await self._fetch_layer_snapped(self.base_wfs_url, "road", bbox)
     
     @profile_async
     async def get_buildings(
@@ -436,16 +978,7 @@ class WFSClient:
     ) -> List[Dict[str, Any]]:
         """건물 데이터 조회"""
         bbox = calculate_bbox(center_x, center_y, bbox_size or settings.BBOX_SIZE)
-        layer = BASE_LAYERS["building"]
-        cache_key = WFSCache.generate_key(self.base_wfs_url, bbox, "building")
-        
-        xml = build_getfeature_xml(
-            layer_name=layer.name,
-            geometry_field=layer.geometry_field,
-            bbox=bbox,
-            property_names=LAYER_PROPS["building"]
-        )
-        return await self._fetch_features(self.base_wfs_url, xml, cache_key)
+        return await self._fetch_layer_snapped(self.base_wfs_url, "building", bbox)
     
     @profile_async
     async def get_transformers(
@@ -457,17 +990,7 @@ class WFSClient:
     ) -> List[Dict[str, Any]]:
         """변압기 데이터 조회"""
         bbox = calculate_bbox(center_x, center_y, bbox_size or settings.BBOX_SIZE)
-        layer = GIS_LAYERS["transformer"]
-        cache_key = WFSCache.generate_key(self.gis_wfs_url, bbox, "transformer")
-        
-        xml = build_getfeature_xml(
-            layer_name=layer.name,
-            geometry_field=layer.geometry_field,
-            bbox=bbox,
-            max_features=max_features,
-            property_names=LAYER_PROPS["transformer"]
-        )
-        return await self._fetch_features(self.gis_wfs_url, xml, cache_key)
+        return await self._fetch_layer_snapped(self.gis_wfs_url, "transformer", bbox, max_features)
     
     @profile_async
     async def get_railways(
@@ -479,16 +1002,7 @@ class WFSClient:
     ) -> List[Dict[str, Any]]:
         """철도 데이터 조회"""
         bbox = calculate_bbox(center_x, center_y, bbox_size or settings.BBOX_SIZE)
-        layer = BASE_LAYERS["railway"]
-        cache_key = WFSCache.generate_key(self.base_wfs_url, bbox, "railway")
-        
-        xml = build_getfeature_xml(
-            layer_name=layer.name,
-            geometry_field=layer.geometry_field,
-            bbox=bbox,
-            max_features=max_features
-        )
-        return await self._fetch_features(self.base_wfs_url, xml, cache_key)
+        return await self._fetch_layer_snapped(self.base_wfs_url, "railway", bbox, max_features)
     
     @profile_async
     async def get_rivers(
@@ -500,16 +1014,7 @@ class WFSClient:
     ) -> List[Dict[str, Any]]:
         """하천 데이터 조회"""
         bbox = calculate_bbox(center_x, center_y, bbox_size or settings.BBOX_SIZE)
-        layer = BASE_LAYERS["river"]
-        cache_key = WFSCache.generate_key(self.base_wfs_url, bbox, "river")
-        
-        xml = build_getfeature_xml(
-            layer_name=layer.name,
-            geometry_field=layer.geometry_field,
-            bbox=bbox,
-            max_features=max_features
-        )
-        return await self._fetch_features(self.base_wfs_url, xml, cache_key)
+        return await self._fetch_layer_snapped(self.base_wfs_url, "river", bbox, max_features)
     
     @profile_async
     async def get_all_data(
@@ -518,17 +1023,17 @@ class WFSClient:
         center_y: float,
         bbox_size: float = None
     ) -> Dict[str, List[Dict[str, Any]]]:
-        """모든 필요 데이터 일괄 조회 (HV/LV 분리)"""
-        import asyncio
-        poles_task = self.get_poles(center_x, center_y, bbox_size)
-        lines_hv_task = self.get_lines_hv(center_x, center_y, bbox_size)
-        lines_lv_task = self.get_lines_lv(center_x, center_y, bbox_size)
-        transformers_task = self.get_transformers(center_x, center_y, bbox_size)
-        roads_task = self.get_roads(center_x, center_y, bbox_size)
-        buildings_task = self.get_buildings(center_x, center_y, bbox_size)
+        """모든 필요 데이터 일괄 조회 (HV/LV 분리, BBox 1회 계산 공유)"""
+        bbox = calculate_bbox(center_x, center_y, bbox_size or settings.BBOX_SIZE)
+        gis, base = self.gis_wfs_url, self.base_wfs_url
         
-        poles, lines_hv, lines_lv, transformers, roads, buildings = await asyncio.gather(
-            poles_task, lines_hv_task, lines_lv_task, transformers_task, roads_task, buildings_task
+        poles, lines_hv, lines_lv, transformers, roads, buildings = await gather_or_cancel(
+            self._fetch_layer_snapped(gis, "pole", bbox),
+            self._fetch_layer_snapped(gis, "line_hv", bbox),
+            self._fetch_layer_snapped(gis, "line_lv", bbox),
+            self._fetch_layer_snapped(gis, "transformer", bbox),
+            self._fetch_layer_snapped(base, "road", bbox),
+            self._fetch_layer_snapped(base, "building", bbox),
         )
         return {
             "poles": poles, 
@@ -540,6 +1045,193 @@ class WFSClient:
             "buildings": buildings
         }
     
+    async def _fetch_layer_snapped(
+        self,
+        wfs_url: str,
+        layer_key: str,
+        bbox: Tuple[float, float, float, float],
+        max_features: int = 1000
+    ) -> List[Dict[str, Any]]:
+        """
+        레이어 BBox 조회 (격자 스냅 + 포함 BBox 캐시)
+        
+        캐시된 BBox가 요청 BBox를 포함하면 재요청 없이 요청 BBox로 필터링하여 반환.
+        미스 시 최근 응답 밀도로 추정한 확장 BBox 피처 수가 max_features의 절반 이하일 때만
+        WFS_CACHE_SNAP 격자로 확장하여 조회 (인접 위치 반복 조회 재사용), 그 외에는 요청 BBox로 조회.
+        잘리지 않은 응답은 포함 조회 대상으로 등록
+        """
+        if not self.use_cache:
+            return await self._fetch_features(wfs_url, build_layer_xml(layer_key, bbox, max_features))
+        
+        covering = self.cache.get_covering(wfs_url, layer_key, bbox)
+        if covering is not None:
+            return filter_features_in_bbox(covering, bbox)
+        
+        # 요청 BBox 캐시 사전 확인 (미스는 이후 _fetch_features 조회에서 1회만 집계)
+        cache_key = WFSCache.generate_key(wfs_url, bbox, layer_key)
+        cached = self.cache.get(cache_key, record_miss=False)
+        if cached is not None:
+            return cached
+        
+        snapped = snap_bbox(bbox, settings.WFS_CACHE_SNAP)
+        density = self.cache.density(wfs_url, layer_key)
+        snapped_area = (snapped[2] - snapped[0]) * (snapped[3] - snapped[1])
+        if snapped != bbox and density is not None and density * snapped_area <= max_features * 0.5:
+            snapped_key = WFSCache.generate_key(wfs_url, snapped, layer_key)
+            features = await self._fetch_features(
+                wfs_url, build_layer_xml(layer_key, snapped, max_features), snapped_key
+            )
+            if len(features) < max_features:
+                self.cache.set_extent(snapped_key, snapped, len(features))
+                return filter_features_in_bbox(features, bbox)
+            # 추정보다 밀집된 지역: 요청 BBox로 재조회
+        
+        features = await self._fetch_features(wfs_url, build_layer_xml(layer_key, bbox, max_features), cache_key)
+        if len(features) < max_features:
+            self.cache.set_extent(cache_key, bbox, len(features))
+        return features
+    
+    async def _fetch_layer_tiled(
+        self,
+        wfs_url: str,
+        layer_key: str,
+        bbox: Tuple[float, float, float, float],
+        max_features: int
+    ) -> List[Dict[str, Any]]:
+        """
+        레이어 BBox 조회 (타일 단위 캐시)
+        
+        요청 BBox를 고정 격자 타일로 분할하여 캐시에 없는 타일만 병렬 요청한 뒤
+        중복 제거 및 BBox 필터링하여 병합. 타일 수가 많으면 단일 요청으로 처리
+        """
+        tile_size = settings.WFS_TILE_SIZE
+        tiles = tile_range(bbox, tile_size)
+        
+        if not self.use_cache or len(tiles) > settings.WFS_TILE_MAX_COUNT:
+            cache_key = WFSCache.generate_key(wfs_url, bbox, layer_key)
+            if (settings.WFS_PAGING_ENABLED and max_features > settings.WFS_PAGE_SIZE
+                    and layer_key in LAYER_SORT_KEYS):
+                return await self._fetch_layer_paged(wfs_url, layer_key, bbox, max_features, cache_key)
+            xml = build_layer_xml(layer_key, bbox, max_features)
+            return await self._fetch_features(wfs_url, xml, cache_key)
+        
+        async def fetch_tile(tx: int, ty: int) -> List[Dict[str, Any]]:
+            tile_bbox = (tx * tile_size, ty * tile_size, (tx + 1) * tile_size, (ty + 1) * tile_size)
+            xml = build_layer_xml(layer_key, tile_bbox, max_features)
+            tile_key = WFSCache.generate_tile_key(wfs_url, layer_key, tx, ty, tile_size, max_features)
+            return await self._fetch_features(wfs_url, xml, tile_key)
+        
+        tile_features = await gather_or_cancel(
+            *(fetch_tile(tx, ty) for tx, ty in tiles), limit=settings.WFS_FANOUT_LIMIT
+        )
+        return merge_tile_features(tile_features, bbox, max_features)
+    
+    async def _fetch_layer_paged(
+        self,
+        wfs_url: str,
+        layer_key: str,
+        bbox: Tuple[float, float, float, float],
+        max_features: int,
+        cache_key: CacheKey
+    ) -> List[Dict[str, Any]]:
+        """
+        레이어 BBox 페이지 조회 (startIndex + 고유 ID 정렬)
+        
+        정렬 기준이 있어야 페이지 경계가 고정되므로 LAYER_SORT_KEYS 레이어만 사용.
+        첫 페이지가 가득 찬 경우(잘림)에만 나머지 페이지를 병렬 요청하고
+        첫 미충족 페이지까지 피처 ID 기준 중복 제거하여 병합
+        """
+        if self.use_cache:
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                return cached
+        
+        page_size = settings.WFS_PAGE_SIZE
+        first = await self._fetch_features(wfs_url, build_layer_xml(layer_key, bbox, page_size, 0))
+        pages = [first]
+        if len(first) >= page_size:
+            starts = range(page_size, max_features, page_size)
+            pages += await gather_or_cancel(*(
+                self._fetch_features(wfs_url, build_layer_xml(layer_key, bbox, page_size, start))
+                for start in starts
+            ), limit=settings.WFS_FANOUT_LIMIT)
+        
+        result = []
+        seen = set()
+        for page in pages:
+            for feature in page:
+                fid = feature.get("id")
+                if fid is not None:
+                    if fid in seen:
+                        continue
+                    seen.add(fid)
+                result.append(feature)
+            if len(page) < page_size:
+                break
+        result = result[:max_features]
+        
+        if self.use_cache:
+            self.cache.set(cache_key, result)
+        return result
+    
+    async def _fetch_layers_batched(
+        self,
+        wfs_url: str,
+        layer_keys: List[str],
+        layers_dict: Dict[str, WFSLayer],
+        bbox: Tuple[float, float, float, float],
+        max_features: int
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        동일 서버 레이어들을 다중 Query 요청 1회로 조회 후 레이어별 분리/캐시
+        
+        Returns:
+            layer_keys 순서의 레이어별 피처 목록
+        """
+        cache_keys = [WFSCache.generate_key(wfs_url, bbox, key) for key in layer_keys]
+        if self.use_cache:
+            cached = [self.cache.get(key) for key in cache_keys]
+            if all(c is not None for c in cached):
+                return cached
+        
+        layers = [layers_dict[key] for key in layer_keys]
+        names = [layer.name for layer in layers]
+        if len(set(names)) < len(names):
+            # 동일 typeName 레이어는 응답에서 구분 불가
+            return await self._fetch_layers_each(wfs_url, layer_keys, bbox, max_features)
+        
+        xml = build_getfeature_xml_multi(
+            [(layer, LAYER_PROPS.get(key)) for key, layer in zip(layer_keys, layers)],
+            bbox,
+            max_features=max_features * len(layers)
+        )
+        features = await self._fetch_features(wfs_url, xml)
+        # 공유 maxFeatures 도달 시 어느 레이어가 잘렸는지 알 수 없으므로 캐시하지 않고 레이어별 재요청
+        by_layer = None if len(features) >= max_features * len(layers) else split_features_by_layer(features, names)
+        if by_layer is None:
+            logger.info(f"다중 Query 응답 분리 불가 ({len(features)}개), 레이어별 요청으로 대체")
+            return await self._fetch_layers_each(wfs_url, layer_keys, bbox, max_features)
+        
+        results = []
+        for layer, cache_key in zip(layers, cache_keys):
+            layer_features = by_layer[layer.name][:max_features]
+            if self.use_cache:
+                self.cache.set(cache_key, layer_features)
+            results.append(layer_features)
+        return results
+    
+    async def _fetch_layers_each(
+        self,
+        wfs_url: str,
+        layer_keys: List[str],
+        bbox: Tuple[float, float, float, float],
+        max_features: int
+    ) -> List[List[Dict[str, Any]]]:
+        """레이어별 개별 요청 (다중 Query 응답을 신뢰할 수 없을 때의 대체 경로)"""
+        return await gather_or_cancel(
+            *(self._fetch_layer_tiled(wfs_url, key, bbox, max_features) for key in layer_keys)
+        )
+    
     @profile_async
     async def get_facilities_by_bbox(
         self,
@@ -547,37 +1239,33 @@ class WFSClient:
         min_y: float,
         max_x: float,
         max_y: float,
-        max_features: int = 5000
+        max_features: int = 5000,
+        include_water_rail: bool = True
     ) -> Dict[str, List[Dict[str, Any]]]:
-        """BBox 기반 모든 시설물 조회 (HV/LV 분리)"""
-        import asyncio
+        """
+        BBox 기반 모든 시설물 조회 (HV/LV 분리)
+        
+        include_water_rail=False 이면 철도/하천 레이어 조회/파싱을 생략하고 빈 목록 반환
+        (해당 레이어를 사용하지 않는 호출부용)
+        """
         bbox = (min_x, min_y, max_x, max_y)
         
-        async def fetch_layer(layer_key: str, layers_dict: Dict, wfs_url: str) -> List[Dict[str, Any]]:
-            layer = layers_dict[layer_key]
-            cache_key = WFSCache.generate_key(wfs_url, bbox, layer_key)
-            # 필드 필터링 적용
-            props = LAYER_PROPS.get(layer_key)
-            xml = build_getfeature_xml(
-                layer_name=layer.name,
-                geometry_field=layer.geometry_field,
-                bbox=bbox,
-                max_features=max_features,
-                property_names=props
-            )
-            return await self._fetch_features(wfs_url, xml, cache_key)
+        gis_keys = ["pole", "line_hv", "line_lv", "transformer"]
+        base_keys = ["road", "building", "railway", "river"] if include_water_rail else ["road", "building"]
         
-        tasks = [
-            fetch_layer("pole", GIS_LAYERS, self.gis_wfs_url),
-            fetch_layer("line_hv", GIS_LAYERS, self.gis_wfs_url),
-            fetch_layer("line_lv", GIS_LAYERS, self.gis_wfs_url),
-            fetch_layer("transformer", GIS_LAYERS, self.gis_wfs_url),
-            fetch_layer("road", BASE_LAYERS, self.base_wfs_url),
-            fetch_layer("building", BASE_LAYERS, self.base_wfs_url),
-            fetch_layer("railway", BASE_LAYERS, self.base_wfs_url),
-            fetch_layer("river", BASE_LAYERS, self.base_wfs_url),
-        ]
-        results = await asyncio.gather(*tasks)
+        if settings.WFS_BATCH_QUERIES:
+            # 서버별 다중 Query 요청 1회씩 (GIS 1회 + BASE 1회)
+            gis_results, base_results = await gather_or_cancel(
+                self._fetch_layers_batched(self.gis_wfs_url, gis_keys, GIS_LAYERS, bbox, max_features),
+                self._fetch_layers_batched(self.base_wfs_url, base_keys, BASE_LAYERS, bbox, max_features),
+            )
+            results = gis_results + base_results
+        else:
+            tasks = [self._fetch_layer_tiled(self.gis_wfs_url, key, bbox, max_features) for key in gis_keys]
+            tasks += [self._fetch_layer_tiled(self.base_wfs_url, key, bbox, max_features) for key in base_keys]
+            results = await gather_or_cancel(*tasks)
+        if not include_water_rail:
+            results += [[], []]
         return {
             "poles": results[0], 
             "lines_hv": results[1], 
@@ -80,18 +80,47 @@ async def startup_event():
     print("--- [Warm-up] 초기 데이터 캐시 예열 시작 ---")
     try:
         wfs_client = WFSClient()
+        # WFS 서버 연결 수립 (DNS/TCP) - 첫 요청 지연 제거
+        connected = await wfs_client.warmup_pool()
+        print(f"--- [Warm-up] WFS 연결 풀 예열: {connected}개 서버 ---")
+        
         # 충주 중앙부 기본 좌표 (사용자가 처음 보게 될 위치)
         cx, cy = 14242500, 4432200
         
-        # 백그라운드에서 초기 데이터 로드 및 계통 분석 수행
-        raw_data = await wfs_client.get_all_data(cx, cy, settings.BBOX_SIZE)
+        # 기본 좌표 주변 BBox 격자를 병렬 조회 (첫 화면 인접 영역까지 캐시)
+        r = settings.WARMUP_GRID_RADIUS
+        step = settings.BBOX_SIZE
+        centers = [(cx, cy)] + [
+            (cx + i * step, cy + j * step)
+            for j in range(-r, r + 1) for i in range(-r, r + 1) if i or j
+        ]
+        results = await asyncio.wait_for(
+            asyncio.gather(
+                *(wfs_client.get_all_data(x, y, settings.BBOX_SIZE) for x, y in centers),
+                return_exceptions=True
+            ),
+            timeout=settings.WARMUP_TIMEOUT
+        )
+        
+        # 기본 좌표 데이터로 계통 분석 수행
+        raw_data = results[0]
+        if isinstance(raw_data, Exception):
+            raise raw_data
         preprocessor = DataPreprocessor()
         preprocessor.process(raw_data)
         
-        print(f"--- [Warm-up] 예열 완료: 전주 {len(raw_data['poles'])}개 로드됨 ---")
+        loaded = sum(1 for result in results if not isinstance(result, Exception))
+        print(f"--- [Warm-up] 예열 완료: BBox {loaded}/{len(centers)}개, 전주 {len(raw_data['poles'])}개 로드됨 ---")
     except Exception as e:
         print(f"--- [Warm-up] 예열 중 오류 (무시): {e} ---")
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    """서버 종료 시 WFS 연결 풀 정리"""
+    from app.core.wfs_client import WFSClient
+    await WFSClient.close_pool()
+
+
 @app.get("/")
 async def root():
     """루트 엔드포인트 - 서버 상태 확인"""
@@ -3,11 +3,24 @@ ELBIX AIDD 요청 모델
 - API 요청 데이터 검증 및 파싱
 """
 
-from pydantic import BaseModel, Field, field_validator
+import re
+
+from pydantic import BaseModel, Field, PrivateAttr, field_validator
 from typing import Optional
 
 from app.config import settings
 
+# "x,y" 좌표 문자열 분리 (숫자 검증은 float 변환으로 수행)
+_COORD_RE = re.compile(r'^\s*([^,\s]+)\s*,\s*([^,\s]+)\s*$')
+
+
+def _parse_coord(v: str) -> tuple[float, float]:
+    """좌표 문자열을 (x, y)로 변환"""
+    m = _COORD_RE.match(v)
+    if m is None:
+        raise ValueError("좌표는 'x,y' 형식이어야 합니다")
+    return float(m.group(1)), float(m.group(2))
+
 
 class LoginRequest(BaseModel):
     """로그인 요청 모델"""
@@ -84,17 +97,15 @@ class DesignRequest(BaseModel):
         description="EPS 서버 URL (기본값 사용 시 생략)"
     )
     
+    # 변환된 좌표 캐시 (get_coord_tuple 반복 호출 시 재파싱 방지)
+    _coord_xy: Optional[tuple[float, float]] = PrivateAttr(default=None)
+    
     @field_validator('coord')
     @classmethod
     def validate_coord(cls, v: str) -> str:
         """좌표 형식 검증"""
         try:
-            parts = v.split(',')
-            if len(parts) != 2:
-                raise ValueError("좌표는 'x,y' 형식이어야 합니다")
-            
-            x = float(parts[0].strip())
-            y = float(parts[1].strip())
+            x, y = _parse_coord(v)
             
             # EPSG:3857 좌표 범위 검증 (대략적인 한국 영역)
             # X: 약 14,000,000 ~ 15,000,000
@@ -119,8 +130,9 @@ class DesignRequest(BaseModel):
     
     def get_coord_tuple(self) -> tuple[float, float]:
         """좌표를 tuple로 반환"""
-        parts = self.coord.split(',')
-        return (float(parts[0].strip()), float(parts[1].strip()))
+        if self._coord_xy is None:
+            self._coord_xy = _parse_coord(self.coord)
+        return self._coord_xy
     
     def get_phase_name(self) -> str:
         """상 이름 반환 (한글)"""
@@ -8,12 +8,14 @@ from app.utils.coordinate import (
     coord_transformer,
     calculate_bbox,
     calculate_distance,
+    squared_distance,
     calculate_line_length,
 )
 from app.utils.geometry import (
     point_to_line_distance,
     nearest_point_on_line,
     point_in_polygon,
+    PolygonQuery,
     line_intersects_polygon,
     lines_intersect,
     buffer_point,
@@ -27,12 +29,14 @@ __all__ = [
     "coord_transformer",
     "calculate_bbox",
     "calculate_distance",
+    "squared_distance",
     "calculate_line_length",
     
     # Geometry
     "point_to_line_distance",
     "nearest_point_on_line",
     "point_in_polygon",
+    "PolygonQuery",
     "line_intersects_polygon",
     "lines_intersect",
     "buffer_point",
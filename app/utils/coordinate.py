@@ -4,28 +4,49 @@ ELBIX AIDD 좌표 변환 유틸리티
 - BBox 계산
 """
 
-from pyproj import Transformer, CRS
-from typing import Tuple, List
+from typing import Callable, Tuple, List, Union, TYPE_CHECKING
+from functools import lru_cache, cached_property
 import math
 
+import numpy as np
+
 from app.config import settings
 
+if TYPE_CHECKING:
+    from pyproj import Transformer
+
+
+@lru_cache(maxsize=None)
+def get_transformer(from_crs: str, to_crs: str) -> "Transformer":
+    """좌표계 쌍별 변환기 (프로세스 전역 캐시, 최초 요청 시 생성)"""
+    # pyproj 임포트 비용이 커서 최초 변환 시점으로 지연
+    from pyproj import Transformer
+    return Transformer.from_crs(from_crs, to_crs, always_xy=True)
+
 
 class CoordinateTransformer:
     """좌표 변환 클래스"""
     
-    def __init__(self):
-        # 변환기 캐시 (성능 최적화)
-        self._transformers = {}
+    def _get_transformer(self, from_crs: str, to_crs: str) -> "Transformer":
+        """변환기 인스턴스 가져오기 (전역 캐시)"""
+        return get_transformer(from_crs, to_crs)
     
-    def _get_transformer(self, from_crs: str, to_crs: str) -> Transformer:
-        """변환기 인스턴스 가져오기 (캐싱)"""
-        key = f"{from_crs}_{to_crs}"
-        if key not in self._transformers:
-            self._transformers[key] = Transformer.from_crs(
-                from_crs, to_crs, always_xy=True
-            )
-        return self._transformers[key]
+    # 고정 좌표계 쌍의 변환 함수 (최초 사용 시 한 번만 조회 후 인스턴스에 바인딩)
+    @cached_property
+    def _input_to_process_fn(self) -> Callable[[float, float], Tuple[float, float]]:
+        return get_transformer(settings.INPUT_CRS, settings.PROCESS_CRS).transform
+    
+    @cached_property
+    def _process_to_input_fn(self) -> Callable[[float, float], Tuple[float, float]]:
+        return get_transformer(settings.PROCESS_CRS, settings.INPUT_CRS).transform
+    
+    @cached_property
+    def _input_to_wgs84_fn(self) -> Callable[[float, float], Tuple[float, float]]:
+        return get_transformer(settings.INPUT_CRS, settings.WGS84_CRS).transform
+    
+    @cached_property
+    def _wgs84_to_input_fn(self) -> Callable[[float, float], Tuple[float, float]]:
+        return get_transformer(settings.WGS84_CRS, settings.INPUT_CRS).transform
     
     def transform_point(
         self,
@@ -46,8 +67,7 @@ class CoordinateTransformer:
         Returns:
             변환된 (x, y) 튜플
         """
-        transformer = self._get_transformer(from_crs, to_crs)
-        return transformer.transform(x, y)
+        return get_transformer(from_crs, to_crs).transform(x, y)
     
     def transform_points(
         self,
@@ -56,7 +76,7 @@ class CoordinateTransformer:
         to_crs: str
     ) -> List[Tuple[float, float]]:
         """
-        여러 좌표 일괄 변환
+        여러 좌표 일괄 변환 (배열 입력으로 PROJ 1회 호출)
         
         Args:
             coords: 좌표 리스트 [(x1, y1), (x2, y2), ...]
@@ -66,48 +86,57 @@ class CoordinateTransformer:
         Returns:
             변환된 좌표 리스트
         """
-        transformer = self._get_transformer(from_crs, to_crs)
-        return [transformer.transform(x, y) for x, y in coords]
+        if not coords:
+            return []
+        arr = np.asarray(coords, dtype=np.float64)
+        xs, ys = self._get_transformer(from_crs, to_crs).transform(arr[:, 0], arr[:, 1])
+        return list(zip(xs.tolist(), ys.tolist()))
+    
+    def transform_points_array(
+        self,
+        arr: np.ndarray,
+        from_crs: str,
+        to_crs: str
+    ) -> np.ndarray:
+        """
+        (N, 2) 좌표 배열 일괄 변환 (PROJ 1회 호출)
+        
+        Args:
+            arr: 좌표 배열 [[x1, y1], [x2, y2], ...]
+            from_crs: 원본 좌표계
+            to_crs: 대상 좌표계
+        
+        Returns:
+            변환된 (N, 2) 좌표 배열
+        """
+        arr = np.asarray(arr, dtype=np.float64)
+        out = np.empty((arr.shape[0], 2), dtype=np.float64)
+        out[:, 0], out[:, 1] = self._get_transformer(from_crs, to_crs).transform(arr[:, 0], arr[:, 1])
+        return out
     
     def input_to_process(self, x: float, y: float) -> Tuple[float, float]:
         """
         입력 좌표계(EPSG:3857) → 처리 좌표계(EPSG:32652)
         """
-        return self.transform_point(
-            x, y,
-            settings.INPUT_CRS,
-            settings.PROCESS_CRS
-        )
+        return self._input_to_process_fn(x, y)
     
     def process_to_input(self, x: float, y: float) -> Tuple[float, float]:
         """
         처리 좌표계(EPSG:32652) → 입력 좌표계(EPSG:3857)
         """
-        return self.transform_point(
-            x, y,
-            settings.PROCESS_CRS,
-            settings.INPUT_CRS
-        )
+        return self._process_to_input_fn(x, y)
     
     def input_to_wgs84(self, x: float, y: float) -> Tuple[float, float]:
         """
         입력 좌표계(EPSG:3857) → WGS84(EPSG:4326)
         """
-        return self.transform_point(
-            x, y,
-            settings.INPUT_CRS,
-            settings.WGS84_CRS
-        )
+        return self._input_to_wgs84_fn(x, y)
     
     def wgs84_to_input(self, lon: float, lat: float) -> Tuple[float, float]:
         """
         WGS84(EPSG:4326) → 입력 좌표계(EPSG:3857)
         """
-        return self.transform_point(
-            lon, lat,
-            settings.WGS84_CRS,
-            settings.INPUT_CRS
-        )
+        return self._wgs84_to_input_fn(lon, lat)
 
 
 def calculate_bbox(
@@ -155,15 +184,32 @@ def calculate_distance(
     Returns:
         거리 (미터)
     """
-    return math.sqrt((x2 - x1) ** 2 + (y2 - y1) ** 2)
+    # math.hypot: 단일 C 호출 (제곱/합/제곱근 개별 연산 대비 빠르고 오버플로 안전)
+    return math.hypot(x2 - x1, y2 - y1)
+
+
+def squared_distance(
+    x1: float,
+    y1: float,
+    x2: float,
+    y2: float
+) -> float:
+    """
+    두 점 사이의 제곱 거리 (대소 비교/임계값 판정 전용, 제곱근 생략)
+    
+    임계값과 비교할 때는 임계값도 제곱하여 비교해야 함
+    """
+    dx = x2 - x1
+    dy = y2 - y1
+    return dx * dx + dy * dy
 
 
-def calculate_line_length(coords: List[Tuple[float, float]]) -> float:
+def calculate_line_length(coords: Union[List[Tuple[float, float]], np.ndarray]) -> float:
     """
-    선(LineString)의 총 길이 계산
+    선(LineString)의 총 길이 계산 (NumPy 벡터 연산)
     
     Args:
-        coords: 좌표 리스트 [(x1, y1), (x2, y2), ...]
+        coords: 좌표 리스트 [(x1, y1), (x2, y2), ...] 또는 (N, 2) 배열
     
     Returns:
         총 길이 (미터)
@@ -171,13 +217,9 @@ def calculate_line_length(coords: List[Tuple[float, float]]) -> float:
     if len(coords) < 2:
         return 0.0
     
-    total = 0.0
-    for i in range(len(coords) - 1):
-        total += calculate_distance(
-            coords[i][0], coords[i][1],
-            coords[i + 1][0], coords[i + 1][1]
-        )
-    return total
+    arr = np.asarray(coords, dtype=np.float64)
+    d = arr[1:, :2] - arr[:-1, :2]
+    return float(np.sqrt(np.einsum('ij,ij->i', d, d)).sum())
 
 
 # 전역 좌표 변환기 인스턴스
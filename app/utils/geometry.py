@@ -3,12 +3,71 @@ ELBIX AIDD 기하학 연산 유틸리티
 - Shapely를 활용한 공간 연산
 """
 
+import shapely
 from shapely.geometry import Point, LineString, Polygon, MultiLineString
-from shapely.ops import nearest_points, split, linemerge
+from shapely.ops import split, linemerge
 from shapely import wkt
 from typing import Tuple, List, Optional, Union
 import math
 
+import numpy as np
+
+
+# 이 꼭짓점 수 이상이면 NumPy 일괄 투영, 미만이면 순수 파이썬 루프가 더 빠름
+_VECTORIZE_MIN_COORDS = 64
+
+
+def _nearest_on_line(
+    point: Tuple[float, float],
+    line_coords: List[Tuple[float, float]]
+) -> Tuple[float, float, float]:
+    """
+    점을 선의 각 선분에 투영하여 가장 가까운 투영점 계산 (GEOS 호출 없음)
+    
+    Returns:
+        (제곱 거리, x, y)
+    """
+    n = len(line_coords)
+    if n < 2:
+        raise ValueError("선 좌표는 2개 이상이어야 합니다")
+    px, py = float(point[0]), float(point[1])
+    
+    if n >= _VECTORIZE_MIN_COORDS:
+        arr = np.asarray(line_coords, dtype=float)[:, :2]
+        a = arr[:-1]
+        ab = arr[1:] - a
+        ab2 = np.einsum("ij,ij->i", ab, ab)
+        t = np.einsum("ij,ij->i", (px, py) - a, ab) / np.where(ab2 == 0, 1.0, ab2)
+        np.clip(t, 0.0, 1.0, out=t)
+        proj = a + ab * t[:, None]
+        diff = proj - (px, py)
+        d2 = np.einsum("ij,ij->i", diff, diff)
+        i = int(d2.argmin())
+        return float(d2[i]), float(proj[i, 0]), float(proj[i, 1])
+    
+    best_d2 = math.inf
+    best_x = best_y = 0.0
+    ax, ay = line_coords[0][0], line_coords[0][1]
+    for k in range(1, n):
+        bx, by = line_coords[k][0], line_coords[k][1]
+        dx, dy = bx - ax, by - ay
+        seg2 = dx * dx + dy * dy
+        if seg2 == 0:
+            qx, qy = ax, ay
+        else:
+            t = ((px - ax) * dx + (py - ay) * dy) / seg2
+            if t < 0.0:
+                t = 0.0
+            elif t > 1.0:
+                t = 1.0
+            qx, qy = ax + dx * t, ay + dy * t
+        ex, ey = qx - px, qy - py
+        d2 = ex * ex + ey * ey
+        if d2 < best_d2:
+            best_d2, best_x, best_y = d2, qx, qy
+        ax, ay = bx, by
+    return best_d2, float(best_x), float(best_y)
+
 
 def point_to_line_distance(
     point: Tuple[float, float],
@@ -24,9 +83,7 @@ def point_to_line_distance(
     Returns:
         최단 거리 (미터)
     """
-    pt = Point(point)
-    line = LineString(line_coords)
-    return pt.distance(line)
+    return math.sqrt(_nearest_on_line(point, line_coords)[0])
 
 
 def nearest_point_on_line(
@@ -43,10 +100,8 @@ def nearest_point_on_line(
     Returns:
         선 위의 가장 가까운 점 (x, y)
     """
-    pt = Point(point)
-    line = LineString(line_coords)
-    nearest = nearest_points(pt, line)[1]
-    return (nearest.x, nearest.y)
+    _, x, y = _nearest_on_line(point, line_coords)
+    return (x, y)
 
 
 def point_in_polygon(
@@ -63,9 +118,34 @@ def point_in_polygon(
     Returns:
         내부에 있으면 True
     """
-    pt = Point(point)
-    poly = Polygon(polygon_coords)
-    return poly.contains(pt)
+    return bool(shapely.contains_xy(Polygon(polygon_coords), point[0], point[1]))
+
+
+class PolygonQuery:
+    """
+    동일 폴리곤 반복 질의 (준비된 지오메트리 재사용)
+    
+    폴리곤을 한 번만 생성/준비(GEOS prepared)하여 다수 점/선 판정 시 재사용.
+    다수 점은 contains_points로 일괄 판정
+    """
+    
+    __slots__ = ("polygon",)
+    
+    def __init__(self, polygon_coords: List[Tuple[float, float]]):
+        self.polygon = Polygon(polygon_coords)
+        shapely.prepare(self.polygon)
+    
+    def contains(self, point: Tuple[float, float]) -> bool:
+        """점이 폴리곤 내부에 있는지 확인"""
+        return bool(shapely.contains_xy(self.polygon, point[0], point[1]))
+    
+    def contains_points(self, xs: np.ndarray, ys: np.ndarray) -> np.ndarray:
+        """여러 점의 폴리곤 내부 여부 (bool 배열)"""
+        return shapely.contains_xy(self.polygon, xs, ys)
+    
+    def intersects_line(self, line_coords: List[Tuple[float, float]]) -> bool:
+        """선이 폴리곤과 교차하는지 확인"""
+        return self.polygon.intersects(LineString(line_coords))
 
 
 def line_intersects_polygon(
@@ -185,21 +265,27 @@ def interpolate_points_on_line(
     Returns:
         배치된 점 좌표 리스트
     """
-    line = LineString(line_coords)
-    length = line.length
+    arr = np.asarray(line_coords, dtype=float)
+    if len(arr) < 2:
+        return []
+    arr = arr[:, :2]
+    
+    # 누적 호 길이 계산 후 모든 배치 위치를 한 번에 보간
+    seg = np.diff(arr, axis=0)
+    seg_len = np.hypot(seg[:, 0], seg[:, 1])
+    cum = np.concatenate(([0.0], np.cumsum(seg_len)))
+    length = cum[-1]
     
     if length == 0:
         return []
     
-    points = []
-    distance = 0.0
-    
-    while distance <= length:
-        point = line.interpolate(distance)
-        points.append((point.x, point.y))
-        distance += interval
+    dist = np.arange(int(length // interval) + 1) * interval
+    idx = np.clip(np.searchsorted(cum, dist, side="right") - 1, 0, len(seg_len) - 1)
+    seg_at = seg_len[idx]
+    t = (dist - cum[idx]) / np.where(seg_at == 0, 1.0, seg_at)
+    pts = arr[idx] + seg[idx] * t[:, None]
     
-    return points
+    return list(zip(pts[:, 0].tolist(), pts[:, 1].tolist()))
 
 
 def merge_lines(
@@ -243,19 +329,22 @@ def calculate_angle(
     Returns:
         각도 (0 ~ 180도)
     """
-    v1 = (p1[0] - p2[0], p1[1] - p2[1])
-    v2 = (p3[0] - p2[0], p3[1] - p2[1])
+    v1x, v1y = p1[0] - p2[0], p1[1] - p2[1]
+    v2x, v2y = p3[0] - p2[0], p3[1] - p2[1]
     
-    dot = v1[0] * v2[0] + v1[1] * v2[1]
-    mag1 = math.sqrt(v1[0] ** 2 + v1[1] ** 2)
-    mag2 = math.sqrt(v2[0] ** 2 + v2[1] ** 2)
+    dot = v1x * v2x + v1y * v2y
+    mag1 = math.hypot(v1x, v1y)
+    mag2 = math.hypot(v2x, v2y)
     
     if mag1 == 0 or mag2 == 0:
         return 0.0
     
     cos_angle = dot / (mag1 * mag2)
     # 부동소수점 오차 보정
-    cos_angle = max(-1.0, min(1.0, cos_angle))
+    if cos_angle > 1.0:
+        cos_angle = 1.0
+    elif cos_angle < -1.0:
+        cos_angle = -1.0
     
     return math.degrees(math.acos(cos_angle))
 
@@ -276,7 +365,7 @@ def is_point_near_line(
     Returns:
         거리 이내면 True
     """
-    return point_to_line_distance(point, line_coords) <= threshold
+    return _nearest_on_line(point, line_coords)[0] <= threshold * threshold
 
 
 def create_line_from_points(
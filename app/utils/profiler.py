@@ -3,6 +3,8 @@ ELBIX AIDD 성능 모니터링 유틸리티
 - 함수 실행 시간 측정
 - 메모리 사용량 추적
 - 병목 지점 분석
+- settings.PROFILING_ENABLED=False 이면 @profile/@profile_async는 원본 함수를 그대로 반환
+  (운영 배포용, 호출당 오버헤드 없음)
 """
 
 import time
@@ -14,10 +16,12 @@ from dataclasses import dataclass, field
 from contextlib import contextmanager
 import threading
 
+from app.config import settings
+
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class ProfileResult:
     """프로파일링 결과"""
     function_name: str
@@ -29,7 +33,12 @@ class ProfileResult:
 
 
 class ProfileStats:
-    """프로파일링 통계 수집기 (싱글톤)"""
+    """
+    프로파일링 통계 수집기 (싱글톤)
+    
+    기록은 스레드별 통계에 잠금 없이 누적하고, 조회 시 전체 스레드 통계를 병합
+    (잠금은 스레드 최초 기록 시 등록에만 사용)
+    """
     
     _instance = None
     _lock = threading.Lock()
@@ -39,8 +48,9 @@ class ProfileStats:
             with cls._lock:
                 if cls._instance is None:
                     cls._instance = super().__new__(cls)
-                    cls._instance._stats: Dict[str, ProfileResult] = {}
-                    cls._instance._enabled = True
+                    cls._instance._local = threading.local()
+                    cls._instance._thread_stats: List[Dict[str, ProfileResult]] = []
+                    cls._instance._enabled = settings.PROFILING_ENABLED
         return cls._instance
     
     @property
@@ -51,43 +61,75 @@ class ProfileStats:
     def enabled(self, value: bool):
         self._enabled = value
     
+    def _local_stats(self) -> Dict[str, ProfileResult]:
+        """현재 스레드 통계 (최초 호출 시 등록)"""
+        stats = getattr(self._local, "stats", None)
+        if stats is None:
+            stats = self._local.stats = {}
+            with self._lock:
+                self._thread_stats.append(stats)
+        return stats
+    
     def record(self, func_name: str, elapsed_ms: float):
         """실행 시간 기록"""
         if not self._enabled:
             return
         
-        with self._lock:
-            if func_name not in self._stats:
-                self._stats[func_name] = ProfileResult(
-                    function_name=func_name,
-                    execution_time_ms=elapsed_ms,
-                    call_count=1,
-                    avg_time_ms=elapsed_ms,
-                    min_time_ms=elapsed_ms,
-                    max_time_ms=elapsed_ms
-                )
-            else:
-                stat = self._stats[func_name]
-                stat.call_count += 1
-                stat.execution_time_ms += elapsed_ms
-                stat.min_time_ms = min(stat.min_time_ms, elapsed_ms)
-                stat.max_time_ms = max(stat.max_time_ms, elapsed_ms)
-                stat.avg_time_ms = stat.execution_time_ms / stat.call_count
+        stats = self._local_stats()
+        stat = stats.get(func_name)
+        if stat is None:
+            stats[func_name] = ProfileResult(
+                function_name=func_name,
+                execution_time_ms=elapsed_ms,
+                call_count=1,
+                avg_time_ms=elapsed_ms,
+                min_time_ms=elapsed_ms,
+                max_time_ms=elapsed_ms
+            )
+        else:
+            stat.call_count += 1
+            stat.execution_time_ms += elapsed_ms
+            if elapsed_ms < stat.min_time_ms:
+                stat.min_time_ms = elapsed_ms
+            if elapsed_ms > stat.max_time_ms:
+                stat.max_time_ms = elapsed_ms
     
     def get_stats(self) -> Dict[str, ProfileResult]:
-        """전체 통계 반환"""
-        return dict(self._stats)
+        """전체 통계 반환 (스레드별 통계 병합)"""
+        merged: Dict[str, ProfileResult] = {}
+        with self._lock:
+            thread_stats = list(self._thread_stats)
+        for stats in thread_stats:
+            for name, stat in list(stats.items()):
+                total = merged.get(name)
+                if total is None:
+                    merged[name] = ProfileResult(
+                        function_name=name,
+                        execution_time_ms=stat.execution_time_ms,
+                        call_count=stat.call_count,
+                        min_time_ms=stat.min_time_ms,
+                        max_time_ms=stat.max_time_ms
+                    )
+                else:
+                    total.call_count += stat.call_count
+                    total.execution_time_ms += stat.execution_time_ms
+                    total.min_time_ms = min(total.min_time_ms, stat.min_time_ms)
+                    total.max_time_ms = max(total.max_time_ms, stat.max_time_ms)
+        for stat in merged.values():
+            stat.avg_time_ms = stat.execution_time_ms / stat.call_count
+        return merged
     
     def get_summary(self) -> str:
         """통계 요약 문자열 반환"""
-        if not self._stats:
+        stats = self.get_stats()
+        if not stats:
             return "No profiling data collected"
         
         lines = ["\n=== 성능 프로파일링 요약 ==="]
         
         # 총 실행 시간 순으로 정렬
         sorted_stats = sorted(
-            self._stats.values(),
+            stats.values(),
             key=lambda x: x.execution_time_ms,
             reverse=True
         )
@@ -107,7 +149,8 @@ class ProfileStats:
     def clear(self):
         """통계 초기화"""
         with self._lock:
-            self._stats.clear()
+            for stats in self._thread_stats:
+                stats.clear()
     
     def print_summary(self):
         """통계 요약 출력"""
@@ -126,20 +169,30 @@ def profile(func: Callable) -> Callable:
         @profile
         def my_function():
             ...
+    
+    PROFILING_ENABLED=False 이면 래핑하지 않음 (이후 enable_profiling() 호출과 무관)
     """
+    if not settings.PROFILING_ENABLED:
+        return func
+    
+    # 호출마다 반복되는 속성 조회 제거 (데코레이션 시점에 바인딩)
+    name = func.__qualname__
+    perf = time.perf_counter
+    record = _profiler.record
+    
     @functools.wraps(func)
     def wrapper(*args, **kwargs):
         if not _profiler.enabled:
             return func(*args, **kwargs)
         
-        start = time.perf_counter()
+        start = perf()
         try:
-            result = func(*args, **kwargs)
-            return result
+            return func(*args, **kwargs)
         finally:
-            elapsed_ms = (time.perf_counter() - start) * 1000
-            _profiler.record(func.__qualname__, elapsed_ms)
-            logger.debug(f"[Profile] {func.__qualname__}: {elapsed_ms:.2f}ms")
+            elapsed_ms = (perf() - start) * 1000
+            record(name, elapsed_ms)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"[Profile] {name}: {elapsed_ms:.2f}ms")
     
     return wrapper
 
@@ -152,20 +205,30 @@ def profile_async(func: Callable) -> Callable:
         @profile_async
         async def my_async_function():
             ...
+    
+    PROFILING_ENABLED=False 이면 래핑하지 않음 (이후 enable_profiling() 호출과 무관)
     """
+    if not settings.PROFILING_ENABLED:
+        return func
+    
+    # 호출마다 반복되는 속성 조회 제거 (데코레이션 시점에 바인딩)
+    name = func.__qualname__
+    perf = time.perf_counter
+    record = _profiler.record
+    
     @functools.wraps(func)
     async def wrapper(*args, **kwargs):
         if not _profiler.enabled:
             return await func(*args, **kwargs)
         
-        start = time.perf_counter()
+        start = perf()
         try:
-            result = await func(*args, **kwargs)
-            return result
+            return await func(*args, **kwargs)
         finally:
-            elapsed_ms = (time.perf_counter() - start) * 1000
-            _profiler.record(func.__qualname__, elapsed_ms)
-            logger.debug(f"[Profile] {func.__qualname__}: {elapsed_ms:.2f}ms")
+            elapsed_ms = (perf() - start) * 1000
+            record(name, elapsed_ms)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"[Profile] {name}: {elapsed_ms:.2f}ms")
     
     return wrapper
 
@@ -189,7 +252,8 @@ def profile_block(name: str):
     finally:
         elapsed_ms = (time.perf_counter() - start) * 1000
         _profiler.record(name, elapsed_ms)
-        logger.debug(f"[Profile] {name}: {elapsed_ms:.2f}ms")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"[Profile] {name}: {elapsed_ms:.2f}ms")
 
 
 class Timer:
@@ -3,9 +3,13 @@
 """
 import asyncio
 import logging
+import sys
 
-# 로깅 설정
-logging.basicConfig(level=logging.DEBUG, format='%(name)s - %(levelname)s - %(message)s')
+# 로깅 설정 (DEBUG 로그는 모듈 전반에서 대량 출력되므로 --debug 지정 시에만 활성화)
+logging.basicConfig(
+    level=logging.DEBUG if "--debug" in sys.argv else logging.INFO,
+    format='%(name)s - %(levelname)s - %(message)s'
+)
 
 from app.core.wfs_client import WFSClient
 from app.core.preprocessor import DataPreprocessor
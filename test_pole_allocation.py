@@ -85,10 +85,8 @@ def test_pole_allocation_with_junction():
     
     allocator = PoleAllocator()
     # 실제 거리 계산
-    from app.utils.coordinate import calculate_distance
-    dist1 = calculate_distance(consumer_coord[0], consumer_coord[1], mid_coord[0], mid_coord[1])
-    dist2 = calculate_distance(mid_coord[0], mid_coord[1], existing_pole_coord[0], existing_pole_coord[1])
-    total_dist = dist1 + dist2
+    from app.utils.coordinate import calculate_line_length
+    total_dist = calculate_line_length(path_coords)
     
     path_result = create_test_path_result(path_coords, total_dist)
     
@@ -201,14 +199,8 @@ def test_complex_path_multiple_junctions():
     
     allocator = PoleAllocator()
     # 실제 거리 계산
-    from app.utils.coordinate import calculate_distance
-    total_dist = 0
-    for i in range(len(path_coords) - 1):
-        dist = calculate_distance(
-            path_coords[i][0], path_coords[i][1],
-            path_coords[i+1][0], path_coords[i+1][1]
-        )
-        total_dist += dist
+    from app.utils.coordinate import calculate_line_length
+    total_dist = calculate_line_length(path_coords)
     
     path_result = create_test_path_result(path_coords, total_dist)
     
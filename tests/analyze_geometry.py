@@ -1,6 +1,7 @@
 import asyncio
 from app.core.wfs_client import WFSClient
-from shapely.geometry import shape, LineString, Point
+import shapely
+from shapely.geometry import LineString
 import json
 
 # Target coordinates
@@ -26,15 +27,19 @@ async def analyze_intersection():
         lines = data.get('lines', []) + data.get('transformers', [])
         
         path_geom = LineString(PATH_COORDS)
+        shapely.prepare(path_geom)
         
         print(f"총 {len(lines)}개의 전선과 비교합니다.")
         
+        # 지오메트리 일괄 변환(GEOS GeoJSON 리더) 후 교차 후보만 일괄 판정 (상세 관계 분석은 교차 전선만)
+        line_geoms = list(shapely.from_geojson([json.dumps(l['geometry']) for l in lines])) if lines else []
+        hits = shapely.intersects(path_geom, line_geoms) if line_geoms else []
+        
         found_issue = False
-        for l in lines:
-            l_geom = shape(l['geometry'])
+        for l, l_geom, hit in zip(lines, line_geoms, hits):
             l_id = l['properties'].get('GID') or l['properties'].get('FTR_IDN')
             
-            if path_geom.intersects(l_geom):
+            if hit:
                 intersection = path_geom.intersection(l_geom)
                 
                 # Check if it's just a touch at endpoints
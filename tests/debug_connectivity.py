@@ -1,8 +1,8 @@
 import asyncio
 import logging
+import numpy as np
 from app.core.design_engine import DesignEngine
 from app.config import settings
-from app.utils.coordinate import calculate_distance
 
 # 로깅 설정
 logging.basicConfig(level=logging.INFO)
@@ -25,16 +25,15 @@ async def debug_connectivity():
     preprocessor = DataPreprocessor()
     processed = preprocessor.process(raw_data)
     
-    # 전주 찾기
+    # 전주 찾기 (좌표 배열로 최근접 전주 일괄 계산)
+    pole_xy = np.array([p.coord[:2] for p in processed.poles], dtype=float).reshape(-1, 2)
+    
     def find_pole(target_coord):
-        best_p = None
-        min_d = float('inf')
-        for p in processed.poles:
-            d = calculate_distance(target_coord[0], target_coord[1], p.coord[0], p.coord[1])
-            if d < min_d:
-                min_d = d
-                best_p = p
-        return best_p, min_d
+        if len(pole_xy) == 0:
+            return None, float('inf')
+        d = np.hypot(pole_xy[:, 0] - target_coord[0], pole_xy[:, 1] - target_coord[1])
+        i = int(d.argmin())
+        return processed.poles[i], float(d[i])
 
     pole_a, dist_a = find_pole(pole_a_coord)
     pole_b, dist_b = find_pole(pole_b_coord)
@@ -53,8 +52,13 @@ async def debug_connectivity():
     from app.core.graph_builder import RoadGraphBuilder
     from shapely.geometry import Point, LineString
     from shapely.ops import nearest_points
+    from shapely.strtree import STRtree
     
     builder = RoadGraphBuilder(processed)
+    
+    # 도로 공간 인덱스 (전주별 최근접 도로 조회)
+    indexed_roads = [road for road in processed.roads if road.geometry]
+    road_tree = STRtree([road.geometry for road in indexed_roads]) if indexed_roads else None
     # 그래프 구축 (내부적으로 _connect_point_to_road 호출)
     # 우리는 로직을 직접 시뮬레이션해서 거리를 봅니다.
     
@@ -64,13 +68,10 @@ async def debug_connectivity():
         min_dist = float('inf')
         nearest_road_id = None
         
-        for road in processed.roads:
-            if not road.geometry: continue
-            # 도로와 전주 거리 계산
-            dist = road.geometry.distance(pole_point)
-            if dist < min_dist:
-                min_dist = dist
-                nearest_road_id = road.id
+        if road_tree is not None:
+            indices, distances = road_tree.query_nearest(pole_point, return_distance=True)
+            min_dist = float(distances[0])
+            nearest_road_id = indexed_roads[int(indices[0])].id
         
         print(f"  - 가장 가까운 도로 거리: {min_dist:.2f}m")
         limit = settings.ROAD_ACCESS_DISTANCE
@@ -1,8 +1,8 @@
 import asyncio
 import logging
+import numpy as np
 from app.core.design_engine import DesignEngine
 from app.config import settings
-from app.utils.coordinate import calculate_distance
 from app.core.pathfinder import PathResult
 
 # 로깅 설정
@@ -22,16 +22,15 @@ async def debug_cost():
     from app.core.preprocessor import DataPreprocessor
     processed = DataPreprocessor().process(raw_data)
     
-    # 전주 객체 찾기
+    # 전주 객체 찾기 (좌표 배열로 최근접 전주 일괄 계산)
+    pole_xy = np.array([p.coord[:2] for p in processed.poles], dtype=float).reshape(-1, 2)
+    
     def get_pole(target_coord):
-        min_d = float('inf')
-        best = None
-        for p in processed.poles:
-            d = calculate_distance(target_coord[0], target_coord[1], p.coord[0], p.coord[1])
-            if d < min_d:
-                min_d = d
-                best = p
-        return best, min_d
+        if len(pole_xy) == 0:
+            return None, float('inf')
+        d = np.hypot(pole_xy[:, 0] - target_coord[0], pole_xy[:, 1] - target_coord[1])
+        i = int(d.argmin())
+        return processed.poles[i], float(d[i])
 
     pole_a, dist_a = get_pole(coord_near_a)
     pole_b, dist_b = get_pole(coord_far_b)
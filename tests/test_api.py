@@ -79,6 +79,19 @@ class TestDesignRequest:
         response = client.post("/api/v1/design", json=invalid_phase_request)
         assert response.status_code == 422
 
+    def test_design_request_coord_parsing(self):
+        """좌표 문자열 검증 및 변환 테스트"""
+        from pydantic import ValidationError
+        from app.models.request import DesignRequest
+
+        req = DesignRequest(coord=" 14241940.5 , 4437601.25 ")
+        assert req.get_coord_tuple() == (14241940.5, 4437601.25)
+        assert req.get_coord_tuple() is req.get_coord_tuple()
+
+        for bad in ["invalid_coord", "14241940.5", "1,2,3", "14241940.5,4437601.25,", "1,4437601.25"]:
+            with pytest.raises(ValidationError):
+                DesignRequest(coord=bad)
+
 
 class TestCoordinateUtils:
     """좌표 유틸리티 테스트"""
@@ -95,7 +108,24 @@ class TestCoordinateUtils:
         
         # 수평 거리
         assert abs(calculate_distance(0, 0, 100, 0) - 100.0) < 0.001
-    
+
+    def test_squared_distance(self):
+        """제곱 거리 테스트"""
+        from app.utils.coordinate import squared_distance
+
+        assert squared_distance(0, 0, 3, 4) == 25.0
+        assert squared_distance(1, 1, 1, 1) == 0.0
+
+    def test_calculate_line_length(self):
+        """선 길이 계산 테스트 (리스트/배열 입력)"""
+        import numpy as np
+        from app.utils.coordinate import calculate_line_length
+
+        assert calculate_line_length([]) == 0.0
+        assert calculate_line_length([(1, 1)]) == 0.0
+        assert abs(calculate_line_length([(0, 0), (3, 4), (3, 14)]) - 15.0) < 0.001
+        assert abs(calculate_line_length(np.array([[0.0, 0.0], [0.0, 2.5]])) - 2.5) < 0.001
+
     def test_calculate_bbox(self):
         """BBox 계산 테스트"""
         from app.utils.coordinate import calculate_bbox
@@ -107,6 +137,17 @@ class TestCoordinateUtils:
         bbox = calculate_bbox(0, 0)
         assert bbox == (-200, -200, 200, 200)
 
+    def test_transform_points_batch_matches_single(self):
+        """일괄 좌표 변환이 개별 변환과 일치하는지 테스트"""
+        import numpy as np
+        from app.utils.coordinate import coord_transformer
+
+        pts = [(14241940.8, 4437601.6), (14242500.0, 4432200.0)]
+        single = [coord_transformer.transform_point(x, y, "EPSG:3857", "EPSG:32652") for x, y in pts]
+        assert coord_transformer.transform_points(pts, "EPSG:3857", "EPSG:32652") == single
+        assert np.allclose(coord_transformer.transform_points_array(np.array(pts), "EPSG:3857", "EPSG:32652"), single)
+        assert coord_transformer.transform_points([], "EPSG:3857", "EPSG:32652") == []
+
 
 class TestGeometryUtils:
     """기하학 유틸리티 테스트"""
@@ -121,6 +162,21 @@ class TestGeometryUtils:
         
         # 선 위의 점
         assert point_to_line_distance((5, 0), line) < 0.001
+
+    def test_nearest_point_on_line(self):
+        """점 투영 테스트 (선분 내부/끝점, 긴 선의 일괄 투영 경로)"""
+        from app.utils.geometry import nearest_point_on_line, point_to_line_distance, is_point_near_line
+
+        line = [(0, 0), (10, 0), (10, 10)]
+        assert nearest_point_on_line((5, 3), line) == (5.0, 0.0)
+        assert nearest_point_on_line((-4, -3), line) == (0.0, 0.0)
+        assert nearest_point_on_line((13, 4), line) == (10.0, 4.0)
+        assert is_point_near_line((13, 4), line, 3.0)
+        assert not is_point_near_line((13, 4), line, 2.9)
+
+        long_line = [(float(i), 0.0) for i in range(200)]
+        assert nearest_point_on_line((150.5, 2.0), long_line) == (150.5, 0.0)
+        assert abs(point_to_line_distance((-3, 4), long_line) - 5.0) < 0.001
     
     def test_interpolate_points_on_line(self):
         """선 위 점 배치 테스트"""
@@ -134,7 +190,16 @@ class TestGeometryUtils:
         assert abs(points[0][0] - 0) < 0.001
         assert abs(points[1][0] - 40) < 0.001
         assert abs(points[2][0] - 80) < 0.001
-    
+
+        # 꺾인 선 (중복 꼭짓점 포함)
+        bent = [(0, 0), (30, 0), (30, 0), (30, 30)]
+        points = interpolate_points_on_line(bent, 20)
+        assert len(points) == 4
+        assert abs(points[1][0] - 20) < 0.001 and abs(points[1][1]) < 0.001
+        assert abs(points[2][0] - 30) < 0.001 and abs(points[2][1] - 10) < 0.001
+        assert abs(points[3][1] - 30) < 0.001
+        assert interpolate_points_on_line([(1, 1), (1, 1)], 10) == []
+
     def test_calculate_angle(self):
         """각도 계산 테스트"""
         from app.utils.geometry import calculate_angle
@@ -145,6 +210,23 @@ class TestGeometryUtils:
         # 직각 (90도)
         assert abs(calculate_angle((0, 0), (0, 5), (5, 5)) - 90.0) < 0.001
 
+    def test_polygon_query(self):
+        """폴리곤 반복 질의 테스트 (단일/일괄 판정 일치)"""
+        import numpy as np
+        from app.utils.geometry import PolygonQuery, point_in_polygon
+
+        square = [(0, 0), (10, 0), (10, 10), (0, 10)]
+        query = PolygonQuery(square)
+
+        xs = np.array([5.0, 15.0, 0.0, 9.9])
+        ys = np.array([5.0, 5.0, 5.0, 0.1])
+        expected = [point_in_polygon((x, y), square) for x, y in zip(xs, ys)]
+        assert expected == [True, False, False, True]
+        assert query.contains_points(xs, ys).tolist() == expected
+        assert query.contains((5, 5)) is True
+        assert query.intersects_line([(-5, 5), (5, 5)])
+        assert not query.intersects_line([(-5, -5), (-1, -1)])
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
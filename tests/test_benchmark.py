@@ -48,6 +48,30 @@ class TestBenchmarkSetup:
         profiler = get_profiler()
         assert profiler.enabled, "프로파일러가 활성화되어야 함"
 
+    def test_profiler_merges_thread_stats(self):
+        """스레드별 기록이 조회 시 병합되는지 확인"""
+        import threading
+
+        clear_profiling_stats()
+        enable_profiling()
+        profiler = get_profiler()
+
+        def work(elapsed_ms):
+            for _ in range(100):
+                profiler.record("merge_test", elapsed_ms)
+
+        threads = [threading.Thread(target=work, args=(ms,)) for ms in (1.0, 3.0)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        stat = profiler.get_stats()["merge_test"]
+        assert stat.call_count == 200
+        assert stat.min_time_ms == 1.0 and stat.max_time_ms == 3.0
+        assert abs(stat.avg_time_ms - 2.0) < 1e-9
+        clear_profiling_stats()
+
 
 @pytest.mark.asyncio
 class TestWFSCacheBenchmark:
@@ -318,6 +318,47 @@ class TestTargetSelector:
         
         assert result.fast_track_target is not None, "Fast Track 대상이 있어야 함"
         assert result.fast_track_target.id == "P1", "P1이 Fast Track 대상이어야 함"
+    
+    def test_duplicate_pole_ids_all_connected(self):
+        """동일 ID 전주가 여러 개일 때 모두 연결 전주로 판정되는지 테스트"""
+        from app.core.preprocessor import ProcessedData, Pole, Line
+        from shapely.geometry import Point, LineString
+        
+        processed_data = ProcessedData()
+        processed_data.poles = [
+            Pole(id="P1", geometry=Point(30, 0), coord=(30, 0), phase_code="1"),
+            Pole(id="P1", geometry=Point(60, 0), coord=(60, 0), phase_code="1"),
+            Pole(id="P2", geometry=Point(90, 0), coord=(90, 0), phase_code="1"),
+        ]
+        processed_data.lines = [
+            Line(id="L1", geometry=LineString([(30, 0), (30, 10)]), coords=[(30, 0), (30, 10)],
+                 line_type="HV", start_pole_id="P1", end_pole_id=None, properties={}),
+        ]
+        
+        selector = TargetSelector(processed_data)
+        assert [p.coord for p in selector._get_single_phase_connectable_poles()] == [(30, 0), (60, 0)]
+        assert [p.coord for p in selector._get_three_phase_connected_poles()] == [(30, 0), (60, 0)]
+    
+    def test_score_kernel_numpy_fallback(self):
+        """Numba 커널과 NumPy 대체 경로의 결과 일치 테스트"""
+        import numpy as np
+        from app.core.target_selector import _score_and_filter_loop, _score_and_filter_numpy
+        
+        rng = np.random.default_rng(0)
+        n = 200
+        px, py = rng.uniform(-500, 500, n), rng.uniform(-500, 500, n)
+        flags = [rng.random(n) < 0.3 for _ in range(5)]
+        
+        for phase_mode in (1, 3):
+            args = (px, py, 10.0, -20.0, *flags, phase_mode, 400.0 ** 2, 40.0 ** 2)
+            expected = _score_and_filter_loop(*args)
+            actual = _score_and_filter_numpy(*args)
+            
+            keep = expected[3]
+            assert np.array_equal(keep, actual[3])
+            assert np.array_equal(expected[2], actual[2])
+            assert np.array_equal(expected[0][keep], actual[0][keep])
+            assert np.allclose(expected[1][keep], actual[1][keep])
 
 
 # 전체 파이프라인 테스트
@@ -0,0 +1,33 @@
+import pytest
+import numpy as np
+
+from app.core.voltage_calculator import VoltageCalculator, WireType
+
+
+def test_calculate_many_matches_calculate():
+    """일괄 계산 결과가 단건 계산과 일치하는지 테스트"""
+    calc = VoltageCalculator()
+    distances = np.array([0.0, 35.5, 120.0, 250.0, 400.0])
+    loads_kw = np.array([5.0, 10.0, 3.0, 20.0, 50.0])
+    
+    for phase_type in ("1", "3"):
+        for wire_type in WireType:
+            batch = calc.calculate_many(distances, loads_kw, phase_type, wire_type)
+            assert batch.shape == distances.shape
+            
+            for i, (distance, load_kw) in enumerate(zip(distances, loads_kw)):
+                single = calc.calculate(distance, load_kw, phase_type, wire_type)
+                assert round(batch["load_current"][i], 2) == pytest.approx(single.load_current)
+                assert round(batch["voltage_drop_v"][i], 2) == pytest.approx(single.voltage_drop_v)
+                assert round(batch["voltage_drop_percent"][i], 2) == pytest.approx(single.voltage_drop_percent)
+                assert bool(batch["is_acceptable"][i]) == single.is_acceptable
+
+
+def test_calculate_many_broadcasts_scalar_load():
+    """스칼라 부하 브로드캐스팅 테스트"""
+    calc = VoltageCalculator()
+    batch = calc.calculate_many([50.0, 100.0, 200.0], 5.0)
+    
+    assert batch.shape == (3,)
+    # 거리에 비례하여 전압 강하 증가
+    assert np.all(np.diff(batch["voltage_drop_v"]) > 0)
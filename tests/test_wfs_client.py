@@ -0,0 +1,346 @@
+import pytest
+
+from app.core import wfs_client
+from app.core.wfs_client import (
+    BASE_LAYERS, GIS_LAYERS, LAYER_PROPS, WFSCache, build_getfeature_xml, build_getfeature_xml_multi, build_layer_xml,
+    merge_tile_features, parse_features, split_features_by_layer, tile_range
+)
+
+
+PAYLOADS = [
+    b'{"type": "FeatureCollection", "crs": {"type": "name"}, '
+    b'"features": [{"id": "p.1", "geometry": {"type": "Point", "coordinates": [1.5, 2.0]}, '
+    b'"properties": {"POLE_ID": "\xea\xb0\x80001"}}]}',
+    b'  [{"id": "p.2"}]',
+    b'{"type": "FeatureCollection", "features": []}',
+    b'{"type": "Feature"}',
+]
+
+
+@pytest.mark.parametrize("raw", PAYLOADS)
+def test_parse_features_matches_full_parse(raw, monkeypatch):
+    """지연 파싱(simdjson) 결과가 전체 파싱 결과와 일치하는지 테스트"""
+    result = parse_features(raw)
+    if wfs_client.SIMDJSON_AVAILABLE:
+        monkeypatch.setattr(wfs_client, "ORJSON_AVAILABLE", False)
+        assert parse_features(raw) == result
+
+
+def test_parse_features_extracts_feature_list():
+    """FeatureCollection에서 features 배열 추출 테스트"""
+    features = parse_features(PAYLOADS[0])
+    assert len(features) == 1
+    assert features[0]["properties"]["POLE_ID"] == "가001"
+    assert features[0]["geometry"]["coordinates"] == [1.5, 2.0]
+    assert parse_features(PAYLOADS[3]) == []
+
+
+def test_parse_features_accepts_bytearray():
+    """청크 수신 버퍼(bytearray) 직접 파싱 테스트"""
+    buf = bytearray(PAYLOADS[1])
+    assert wfs_client._is_json_payload(buf)
+    assert parse_features(buf) == [{"id": "p.2"}]
+    assert not wfs_client._is_json_payload(bytearray(b'<?xml version="1.0"?>'))
+
+
+def test_cache_key_quantizes_to_10m_grid():
+    """캐시 키 10m 격자 양자화 테스트"""
+    key = WFSCache.generate_key("http://wfs", (1000.4, 2000.0, 1400.0, 2404.9), "pole")
+    assert key == WFSCache.generate_key("http://wfs", (1009.9, 2001.0, 1401.0, 2400.0), "pole")
+    assert key != WFSCache.generate_key("http://wfs", (1000.4, 2000.0, 1400.0, 2404.9), "building")
+    assert key != WFSCache.generate_key("http://wfs", (1020.0, 2000.0, 1420.0, 2404.9), "pole")
+
+
+def test_cache_routes_static_layers_to_long_ttl():
+    """기본도 레이어는 정적 캐시, 설비 레이어는 동적 캐시에 저장되는지 테스트"""
+    cache = WFSCache()
+    cache.clear()
+    bbox = (0.0, 0.0, 400.0, 400.0)
+    cache.set(WFSCache.generate_key("http://base", bbox, "building"), [{"id": "b.1"}])
+    cache.set(WFSCache.generate_key("http://gis", bbox, "pole"), [{"id": "p.1"}])
+    
+    stats = cache.stats
+    assert stats["static_size"] == 1
+    assert stats["dynamic_size"] == 1
+    assert cache.get(WFSCache.generate_key("http://base", bbox, "building")) == [{"id": "b.1"}]
+    cache.clear()
+
+
+def test_tile_range_covers_bbox():
+    """BBox를 덮는 타일 인덱스 산출 테스트"""
+    assert tile_range((100.0, 100.0, 400.0, 400.0), 512.0) == [(0, 0)]
+    assert tile_range((-10.0, 500.0, 600.0, 600.0), 512.0) == [(-1, 0), (0, 0), (1, 0), (-1, 1), (0, 1), (1, 1)]
+
+
+def test_merge_tile_features_dedupes_and_clips():
+    """타일 병합 시 중복 제거 및 요청 BBox 필터링 테스트"""
+    point = lambda fid, x, y: {"id": fid, "geometry": {"type": "Point", "coordinates": [x, y]}}
+    line = {"id": "l.1", "geometry": {"type": "LineString", "coordinates": [[500.0, 10.0], [530.0, 10.0]]}}
+    tiles = [
+        [point("p.1", 10.0, 10.0), point("p.2", 900.0, 900.0), line],
+        [line, point("p.3", 520.0, 20.0)],
+    ]
+    merged = merge_tile_features(tiles, (0.0, 0.0, 510.0, 100.0), 5000)
+    assert [f["id"] for f in merged] == ["p.1", "l.1"]
+    assert "_bbox" not in line
+    assert len(merge_tile_features(tiles, (0.0, 0.0, 1000.0, 1000.0), 2)) == 2
+
+
+def test_build_getfeature_xml_fills_template():
+    """GetFeature XML 템플릿 치환 테스트"""
+    xml = build_getfeature_xml("AI_FAC_001.GIS_LOC", "GIS_LOC", (1.5, 2.0, 401.5, 402.0),
+                               max_features=500, property_names=["GID", "POLE_ID", "GIS_LOC"])
+    assert isinstance(xml, bytes)
+    text = xml.decode("utf-8")
+    assert 'maxFeatures="500"' in text
+    assert '<wfs:Query typeName="AI_FAC_001.GIS_LOC" srsName="EPSG:3857">' in text
+    assert text.count("<wfs:PropertyName>GIS_LOC</wfs:PropertyName>") == 1
+    assert "<gml:lowerCorner>1.5 2.0</gml:lowerCorner>" in text
+    assert "<gml:upperCorner>401.5 402.0</gml:upperCorner>" in text
+    assert b"PropertyName>GID<" not in build_getfeature_xml("L", "G", (0, 0, 1, 1))
+
+
+def test_cache_stores_empty_results_in_negative_tier():
+    """빈 결과는 짧은 TTL 캐시에 저장되고 조회 시 히트되는지 테스트"""
+    cache = WFSCache()
+    cache.clear()
+    key = WFSCache.generate_key("http://base", (0.0, 0.0, 400.0, 400.0), "river")
+    assert cache.get(key, record_miss=False) is None
+    assert cache.stats["misses"] == 0
+    cache.set(key, [])
+    assert cache.get(key) == []
+    assert cache.stats["negative_size"] == 1
+    assert cache.stats["static_size"] == 0
+    
+    cache.set(key, [{"id": "r.1"}])
+    assert cache.get(key) == [{"id": "r.1"}]
+    assert cache.stats["negative_size"] == 0
+    cache.clear()
+
+
+def test_disk_cache_shared_across_instances(tmp_path, monkeypatch):
+    """디스크 캐시 설정 시 새 캐시 인스턴스(프로세스 재시작)에서 재사용되는지 테스트"""
+    monkeypatch.setattr(wfs_client.settings, "WFS_DISK_CACHE_DIR", str(tmp_path))
+    key = WFSCache.generate_key("http://gis", (0.0, 0.0, 400.0, 400.0), "pole")
+    WFSCache().set(key, [{"id": "p.1"}])
+    WFSCache().set(WFSCache.generate_key("http://gis", (0.0, 0.0, 400.0, 400.0), "line"), [])
+    assert len(list(tmp_path.glob("wfs_*.json"))) == 1
+    
+    fresh = WFSCache()
+    assert fresh.get(key) == [{"id": "p.1"}]
+    assert fresh.stats["dynamic_size"] == 1
+    
+    monkeypatch.setattr(wfs_client.settings, "WFS_CACHE_TTL_DYNAMIC", -1)
+    assert WFSCache().get(key) is None
+
+
+def test_multi_query_xml_and_split_by_layer():
+    """다중 Query XML 생성 및 응답 레이어 분리 테스트"""
+    layers = [GIS_LAYERS["pole"], GIS_LAYERS["line_hv"]]
+    xml = build_getfeature_xml_multi([(layers[0], ["GID"]), (layers[1], None)], (0, 0, 10, 10), max_features=20)
+    assert xml.count(b"<wfs:Query ") == 2
+    assert b'maxFeatures="20"' in xml
+    
+    names = [layer.name for layer in layers]
+    features = [{"id": f"{names[1]}.7"}, {"id": f"{names[0]}.1"}]
+    split = split_features_by_layer(features, names)
+    assert split[names[0]] == [{"id": f"{names[0]}.1"}]
+    assert split[names[1]] == [{"id": f"{names[1]}.7"}]
+    assert split_features_by_layer(features + [{"id": "unknown.3"}], names) is None
+    assert split_features_by_layer(features + [{}], names) is None
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("batch_features", [
+    [{"id": "AI_FAC_001.GIS_LOC.1"}, {"id": "3"}],
+    [{"id": f"AI_FAC_001.GIS_LOC.{i}"} for i in range(4)],
+])
+async def test_batched_fetch_falls_back_per_layer(batch_features, monkeypatch):
+    """분리 불가 피처 또는 공유 maxFeatures 도달 시 캐시 없이 레이어별 요청으로 대체하는지 테스트"""
+    from app.core.wfs_client import WFSClient
+    
+    batch_calls = []
+    
+    async def fake_fetch(self, url, xml, cache_key=None):
+        batch_calls.append(xml)
+        return batch_features
+    
+    async def fake_tiled(self, url, layer_key, bbox, max_features):
+        return [{"id": layer_key}]
+    
+    monkeypatch.setattr(WFSClient, "_fetch_features", fake_fetch)
+    monkeypatch.setattr(WFSClient, "_fetch_layer_tiled", fake_tiled)
+    monkeypatch.setattr(wfs_client, "_wfs_cache", WFSCache())
+    client = WFSClient(gis_wfs_url="http://gis")
+    
+    bbox = (0.0, 0.0, 400.0, 400.0)
+    results = await client._fetch_layers_batched("http://gis", ["pole", "line_hv"], GIS_LAYERS, bbox, 2)
+    assert results == [[{"id": "pole"}], [{"id": "line_hv"}]]
+    assert len(batch_calls) == 1
+    assert client.cache.get(WFSCache.generate_key("http://gis", bbox, "pole")) is None
+
+
+@pytest.mark.parametrize("layer_key", ["pole", "line_hv", "transformer", "building", "railway"])
+def test_build_layer_xml_matches_generic_builder(layer_key):
+    """레이어별 사전 생성 템플릿이 범용 XML 생성 결과와 일치하는지 테스트"""
+    layer = {**GIS_LAYERS, **BASE_LAYERS}[layer_key]
+    bbox = (14135000.25, 4512000.0, 14135400.25, 4512400.5)
+    expected = build_getfeature_xml(layer.name, layer.geometry_field, bbox,
+                                    max_features=2000, property_names=LAYER_PROPS.get(layer_key))
+    assert build_layer_xml(layer_key, bbox, 2000) == expected
+
+
+def test_paged_layer_xml_sorts_by_unique_id():
+    """페이지 조회 XML에 startIndex와 고유 ID 정렬(Filter 뒤)이 포함되는지 테스트"""
+    bbox = (0.0, 0.0, 400.0, 400.0)
+    xml = build_layer_xml("pole", bbox, 1000, 2000)
+    assert b'startIndex="2000" maxFeatures="1000"' in xml
+    assert xml.index(b"</ogc:Filter>") < xml.index(b"<ogc:PropertyName>GID</ogc:PropertyName>\n") < xml.index(b"</wfs:Query>")
+    assert b"SortBy" not in build_layer_xml("pole", bbox, 1000)
+
+
+@pytest.mark.asyncio
+async def test_gather_or_cancel_cancels_siblings_on_error():
+    """한 요청 실패 시 나머지 요청 취소 및 원래 예외 전파 테스트"""
+    import asyncio
+    from app.core.wfs_client import gather_or_cancel
+    
+    cancelled = []
+    
+    async def slow():
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append(True)
+            raise
+    
+    async def fail():
+        await asyncio.sleep(0)
+        raise ValueError("layer error")
+    
+    assert await gather_or_cancel(asyncio.sleep(0, result=1), asyncio.sleep(0, result=2)) == [1, 2]
+    with pytest.raises(ValueError, match="layer error"):
+        await gather_or_cancel(slow(), fail())
+    assert cancelled == [True]
+
+
+@pytest.mark.asyncio
+async def test_snapped_fetch_reuses_covering_cache(monkeypatch):
+    """격자 스냅 조회 결과를 인접 BBox 조회에서 재사용하는지 테스트"""
+    from app.core.wfs_client import WFSClient, snap_bbox
+    
+    assert snap_bbox((14135011.0, 4512011.0, 14135411.0, 4512411.0), 100.0) == (14135000, 4512000, 14135500, 4512500)
+    assert snap_bbox((1.5, 2.5, 3.5, 4.5), 0) == (1.5, 2.5, 3.5, 4.5)
+    
+    requests = []
+    
+    async def fake_fetch(self, url, xml, cache_key=None):
+        requests.append(xml)
+        features = [
+            {"id": "p.1", "geometry": {"type": "Point", "coordinates": [14135050.0, 4512050.0]}},
+            {"id": "p.2", "geometry": {"type": "Point", "coordinates": [14135450.0, 4512450.0]}},
+        ]
+        self.cache.set(cache_key, features)
+        return features
+    
+    monkeypatch.setattr(WFSClient, "_fetch_features", fake_fetch)
+    monkeypatch.setattr(wfs_client, "_wfs_cache", WFSCache())
+    client = WFSClient(gis_wfs_url="http://gis")
+    
+    # 밀도 기록 없음: 요청 BBox 그대로 조회
+    await client._fetch_layer_snapped("http://gis", "pole", (14135011.0, 4512011.0, 14135411.0, 4512411.0))
+    assert b"<gml:lowerCorner>14135011.0 4512011.0</gml:lowerCorner>" in requests[0]
+    
+    # 희소 레이어: 스냅 BBox로 조회 후 인접 BBox는 재사용
+    second = await client._fetch_layer_snapped("http://gis", "pole", (14135030.0, 4512030.0, 14135430.0, 4512430.0))
+    third = await client._fetch_layer_snapped("http://gis", "pole", (14135020.0, 4512020.0, 14135420.0, 4512420.0))
+    assert len(requests) == 2
+    assert b"<gml:lowerCorner>14135000.0 4512000.0</gml:lowerCorner>" in requests[1]
+    assert [f["id"] for f in second] == ["p.1"]
+    assert [f["id"] for f in third] == ["p.1"]
+    
+    # 스냅 BBox 밖 요청은 재조회
+    await client._fetch_layer_snapped("http://gis", "pole", (14135300.0, 4512300.0, 14135700.0, 4512700.0))
+    assert len(requests) == 3
+    
+    # 밀집 레이어(스냅 시 max_features 절반 초과 예상): 확장 없이 요청 BBox만 1회 조회
+    await client._fetch_layer_snapped("http://gis", "line_hv", (14135011.0, 4512011.0, 14135411.0, 4512411.0), 3)
+    await client._fetch_layer_snapped("http://gis", "line_hv", (14136011.0, 4512011.0, 14136411.0, 4512411.0), 3)
+    assert len(requests) == 5
+    assert b"<gml:lowerCorner>14136011.0 4512011.0</gml:lowerCorner>" in requests[4]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_fetches_share_one_request(monkeypatch):
+    """동일 캐시 키 동시 요청이 하나의 요청 결과를 공유하는지 테스트"""
+    import asyncio
+    from app.core.wfs_client import WFSClient
+    
+    calls = []
+    release = asyncio.Event()
+    
+    async def fake_request(self, url, xml, cache_key):
+        calls.append(cache_key)
+        await release.wait()
+        return [{"id": "p.1"}]
+    
+    monkeypatch.setattr(WFSClient, "_request_features", fake_request)
+    monkeypatch.setattr(wfs_client, "_wfs_cache", WFSCache())
+    client = WFSClient(gis_wfs_url="http://gis")
+    key = WFSCache.generate_key("http://gis", (0, 0, 100, 100), "pole")
+    
+    tasks = [asyncio.ensure_future(client._fetch_features("http://gis", b"<x/>", key)) for _ in range(3)]
+    await asyncio.sleep(0)
+    release.set()
+    results = await asyncio.gather(*tasks)
+    assert len(calls) == 1
+    assert results[0] is results[1] is results[2]
+    assert not WFSClient._inflight
+    
+    # 대기자가 모두 취소되면 공유 요청도 취소
+    release.clear()
+    other = WFSCache.generate_key("http://gis", (0, 0, 200, 200), "pole")
+    waiter = asyncio.ensure_future(client._fetch_features("http://gis", b"<x/>", other))
+    await asyncio.sleep(0)
+    shared = WFSClient._inflight[other]
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+    await asyncio.sleep(0)
+    assert shared.cancelled()
+    assert not WFSClient._inflight
+    
+    # 마지막 대기자 취소 직후 같은 틱에 도착한 호출자는 새 요청 시작
+    calls.clear()
+    third = WFSCache.generate_key("http://gis", (0, 0, 300, 300), "pole")
+    first = asyncio.ensure_future(client._fetch_features("http://gis", b"<x/>", third))
+    await asyncio.sleep(0)
+    first.cancel()
+    second = asyncio.ensure_future(client._fetch_features("http://gis", b"<x/>", third))
+    await asyncio.sleep(0)
+    release.set()
+    assert await second == [{"id": "p.1"}]
+    assert first.cancelled()
+    assert len(calls) == 2
+    assert not WFSClient._inflight
+
+
+@pytest.mark.asyncio
+async def test_gather_or_cancel_limits_concurrency():
+    """limit 지정 시 동시 실행 수 제한 및 결과 순서 유지 테스트"""
+    import asyncio
+    from app.core.wfs_client import gather_or_cancel
+    
+    running = 0
+    peak = 0
+    
+    async def job(i):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.001)
+        running -= 1
+        return i
+    
+    assert await gather_or_cancel(*(job(i) for i in range(10)), limit=3) == list(range(10))
+    assert peak == 3